@@ -4,17 +4,44 @@ Extract sound ID from TikTok video URL
 """
 
 import requests
+import atexit
+import dbm
 import json
+import pickle
 import re
+import shelve
 import sys
-
-def extract_sound_id_from_video(video_url):
+import threading
+import time
+
+# One keep-alive session per thread, so pooled lookups reuse TCP/TLS connections
+_thread_local = threading.local()
+
+# On-disk cache of successful video -> sound ID lookups (shelve, keyed by URL)
+SOUND_ID_CACHE_PATH = '.sound_id_cache'
+SOUND_ID_CACHE_TTL = 7 * 86400  # seconds
+# Shelf is opened once per run; the lock only guards the handle, not the fetch
+_cache_lock = threading.Lock()
+_sound_id_cache = None  # False once the shelf has failed to open
+# Corrupt/partial cache files or a dbm held by another run: fall back to uncached lookups
+# (ValueError/SyntaxError come from dbm.dumb parsing a damaged index)
+_CACHE_ERRORS = (OSError, pickle.UnpicklingError, EOFError, ValueError, SyntaxError) + dbm.error
+
+def get_session():
+    """Return this thread's shared requests.Session"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+def extract_sound_id_from_video(video_url, session=None):
     """
     Extract the sound/music ID from a TikTok video by fetching its webpage
     and parsing the embedded JSON data.
 
     Args:
         video_url: TikTok video URL (e.g., https://www.tiktok.com/@user/video/123...)
+        session: requests.Session to use (defaults to this thread's shared session)
 
     Returns:
         tuple: (sound_id, song_title) or (None, None) if not found
@@ -29,7 +56,7 @@ def extract_sound_id_from_video(video_url):
         }
 
         # Fetch the video page HTML
-        response = requests.get(video_url, headers=headers, timeout=15)
+        response = (session or get_session()).get(video_url, headers=headers, timeout=15)
 
         if response.status_code != 200:
             return None, None
@@ -62,12 +89,54 @@ def extract_sound_id_from_video(video_url):
         return None, None
 
 
-def extract_sound_id_from_music_link(music_link):
+def _get_sound_id_cache():
+    """Return the run's shared cache shelf (None if unavailable), opening it on first use (hold _cache_lock)"""
+    global _sound_id_cache
+    if _sound_id_cache is None:
+        try:
+            _sound_id_cache = shelve.open(SOUND_ID_CACHE_PATH)
+            atexit.register(_sound_id_cache.close)
+        except _CACHE_ERRORS as e:
+            print(f"Sound ID cache unavailable, looking up uncached: {e}", file=sys.stderr)
+            _sound_id_cache = False
+    return _sound_id_cache if _sound_id_cache is not False else None
+
+
+def cached_extract_sound_id_from_video(video_url):
+    """
+    extract_sound_id_from_video backed by the on-disk cache, so re-runs skip
+    pages already resolved. Failed lookups are not cached. Thread-safe.
+    """
+    entry = None
+    with _cache_lock:
+        cache = _get_sound_id_cache()
+        if cache is not None:
+            try:
+                entry = cache.get(video_url)
+            except _CACHE_ERRORS:
+                pass
+    if entry and time.time() - entry[0] < SOUND_ID_CACHE_TTL:
+        return entry[1]
+
+    result = extract_sound_id_from_video(video_url)
+    if result[0]:
+        with _cache_lock:
+            cache = _get_sound_id_cache()
+            if cache is not None:
+                try:
+                    cache[video_url] = (time.time(), result)
+                except _CACHE_ERRORS:
+                    pass
+    return result
+
+
+def extract_sound_id_from_music_link(music_link, session=None):
     """
     Extract sound ID from a TikTok music link by fetching the music page.
 
     Args:
         music_link: TikTok music URL (e.g., https://www.tiktok.com/music/Pink-Skies-7371957890313275408)
+        session: requests.Session to use (defaults to this thread's shared session)
 
     Returns:
         tuple: (sound_id, song_title, artist_name) or (None, None, None) if not found
@@ -88,7 +157,7 @@ def extract_sound_id_from_music_link(music_link):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
-        response = requests.get(music_link, headers=headers, timeout=15)
+        response = (session or get_session()).get(music_link, headers=headers, timeout=15)
 
         if response.status_code != 200:
             return url_sound_id, None, None
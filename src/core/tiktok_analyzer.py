@@ -9,6 +9,7 @@ import argparse
 import subprocess
 import json
 import re
+import time
 from datetime import datetime
 from extract_sound_id import extract_sound_id_from_video
 
@@ -27,13 +28,21 @@ def build_profile_url(username):
     """Build TikTok profile URL from username"""
     return f"https://www.tiktok.com/@{username}"
 
-def scrape_profile_videos_detailed(profile_url, limit=10):
+def scrape_profile_videos_detailed(profile_url, limit=10, verbose=True, timeout=None, check=False):
     """
     Scrape videos from a TikTok profile with full metadata including song info
+
+    timeout bounds the whole scrape (yt-dlp listing plus per-video sound ID
+    fetches) and raises subprocess.TimeoutExpired once it passes. check is
+    passed to subprocess.run: a failed yt-dlp raises CalledProcessError
+    instead of printing the error and returning [].
     """
-    print(f"Analyzing profile: {profile_url}")
-    print(f"Fetching detailed metadata for recent videos...")
-    print("")
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    if verbose:
+        print(f"Analyzing profile: {profile_url}")
+        print(f"Fetching detailed metadata for recent videos...")
+        print("")
 
     # Use yt-dlp to get full video metadata
     cmd = [
@@ -44,7 +53,7 @@ def scrape_profile_videos_detailed(profile_url, limit=10):
         profile_url
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=check)
 
     if result.returncode != 0:
         print(f"Error scraping profile: {result.stderr}")
@@ -103,7 +112,10 @@ def scrape_profile_videos_detailed(profile_url, limit=10):
 
                 # Extract sound ID by fetching the video page
                 # This is the ONLY reliable way to get the actual sound ID
-                print(f"  Fetching sound ID for video {video_data.get('id')}...")
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                if verbose:
+                    print(f"  Fetching sound ID for video {video_data.get('id')}...")
                 sound_id, song_title_from_page = extract_sound_id_from_video(video_url)
 
                 # Use song title from video page if available, otherwise from yt-dlp
@@ -151,6 +163,17 @@ def scrape_profile_videos_detailed(profile_url, limit=10):
 
     return videos[:limit]
 
+def analyze(url_or_username, limit=10, verbose=False, timeout=None, check=False):
+    """
+    Analyze a profile in-process and return its video dicts (newest first).
+    Lets other scripts import this instead of shelling out and parsing stdout.
+    """
+    username = get_profile_username(url_or_username)
+    if not username:
+        return []
+    return scrape_profile_videos_detailed(build_profile_url(username), limit, verbose=verbose,
+                                          timeout=timeout, check=check)
+
 def format_number(num):
     """Format number with commas"""
     if num >= 1000000:
@@ -240,6 +263,8 @@ def main():
                        help='TikTok username or profile URL')
     parser.add_argument('--limit', type=int, default=10,
                        help='Number of recent videos to analyze (default: 10)')
+    parser.add_argument('--json', action='store_true',
+                       help='Print one JSON object per video instead of the text report')
 
     args = parser.parse_args()
 
@@ -252,18 +277,25 @@ def main():
     # Build full profile URL
     profile_url = build_profile_url(username)
 
-    print(f"\n🔍 TikTok Profile Analyzer")
-    print(f"Profile: @{username}")
-    print(f"=" * 100)
-    print("")
+    if not args.json:
+        print(f"\n🔍 TikTok Profile Analyzer")
+        print(f"Profile: @{username}")
+        print(f"=" * 100)
+        print("")
 
     # Scrape and analyze videos
-    videos = scrape_profile_videos_detailed(profile_url, args.limit)
+    videos = scrape_profile_videos_detailed(profile_url, args.limit, verbose=not args.json)
 
     if not videos:
         print("No videos found or unable to scrape profile")
         return 1
 
+    # Machine-readable output for other scripts (one object per line)
+    if args.json:
+        for video in videos:
+            print(json.dumps(video, default=str))
+        return 0
+
     # Display analysis
     display_video_analysis(videos)
 
@@ -10,6 +10,7 @@ from collections import defaultdict
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Import configuration
 try:
@@ -475,6 +476,181 @@ def get_engagement_class(rate):
     else:
         return 'engagement-low'
 
+def _render_sounds_tab(sorted_sounds, art_map):
+    """Render the sound sections of the Sounds tab"""
+    parts = []
+    for i, (sound_key, stats) in enumerate(sorted_sounds, 1):
+        engagement_class = get_engagement_class(stats['avg_engagement_rate'])
+        
+        album_art_path = art_map.get(sound_key)
+
+        # Build album art HTML
+        album_art_html = ''
+        if album_art_path:
+            album_art_html = f'<img src="{album_art_path}" alt="{stats["song"]} - {stats["artist"]}" class="album-art">'
+        
+        parts.append(f'''
+        <div class="sound-section">
+            <div class="sound-header">
+                <div class="sound-title-row">
+                    <span class="sound-rank">{i}</span>
+                    <div class="album-art-container">
+                        {album_art_html}
+                        <div class="sound-info">
+                            <div class="sound-title">{stats['song']}</div>
+                            <div class="sound-artist">{stats['artist']}</div>
+                        </div>
+                    </div>
+                </div>
+                <div class="sound-meta">
+                    <div class="meta-item">
+                        <span class="meta-label">Total Uses</span>
+                        <span class="meta-value">{stats['total_uses']}</span>
+                    </div>
+                    <div class="meta-item">
+                        <span class="meta-label">Avg Views</span>
+                        <span class="meta-value">{format_number(stats['avg_views'])}</span>
+                    </div>
+                    <div class="meta-item">
+                        <span class="meta-label">Avg Engagement</span>
+                        <span class="meta-value">{stats['avg_engagement_rate']:.2f}%</span>
+                    </div>
+                    <div class="meta-item">
+                        <span class="meta-label">Total Views</span>
+                        <span class="meta-value">{format_number(stats['total_views'])}</span>
+                    </div>
+                </div>
+                <div class="accounts-used">
+                    <div class="accounts-label">Used by {len(stats['accounts'])} account(s):</div>
+                    <div class="account-tags">
+''')
+
+        for account in stats['accounts']:
+            parts.append(f'                        <span class="account-tag">{account}</span>\n')
+
+        parts.append('''                    </div>
+                </div>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Rank</th>
+                        <th>Account</th>
+                        <th>Views</th>
+                        <th>Likes</th>
+                        <th>Comments</th>
+                        <th>Shares</th>
+                        <th>Engagement</th>
+                        <th>Link</th>
+                    </tr>
+                </thead>
+                <tbody>
+''')
+
+        for j, video in enumerate(stats['videos'][:10], 1):
+            engagement_class_video = get_engagement_class(video['engagement_rate'])
+            parts.append(f'''                    <tr>
+                        <td class="video-rank">#{j}</td>
+                        <td class="account-name">{video['account']}</td>
+                        <td class="metric-value">{format_number(video['views'])}</td>
+                        <td class="metric-value">{format_number(video['likes'])}</td>
+                        <td class="metric-value">{format_number(video['comments'])}</td>
+                        <td class="metric-value">{format_number(video['shares'])}</td>
+                        <td><span class="engagement-badge {engagement_class_video}">{video['engagement_rate']:.2f}%</span></td>
+                        <td><a href="{video['url']}" class="video-link" target="_blank">View</a></td>
+                    </tr>
+''')
+
+        parts.append('''                </tbody>
+            </table>
+        </div>
+''')
+
+    return ''.join(parts)
+
+def _render_accounts_tab(sorted_accounts):
+    """Render the account sections of the Accounts tab"""
+    parts = []
+    for account, stats in sorted_accounts:
+        parts.append(f'''
+        <div class="sound-section">
+            <div class="sound-header">
+                <div class="sound-title-row">
+                    <div class="sound-info">
+                        <div class="sound-title">{account}</div>
+                        <div class="sound-artist">Account Performance</div>
+                    </div>
+                </div>
+                <div class="sound-meta">
+                    <div class="meta-item">
+                        <span class="meta-label">Total Videos</span>
+                        <span class="meta-value">{stats['total_videos']}</span>
+                    </div>
+                    <div class="meta-item">
+                        <span class="meta-label">Unique Sounds</span>
+                        <span class="meta-value">{stats['unique_sounds_count']}</span>
+                    </div>
+                    <div class="meta-item">
+                        <span class="meta-label">Avg Views</span>
+                        <span class="meta-value">{format_number(stats['avg_views'])}</span>
+                    </div>
+                    <div class="meta-item">
+                        <span class="meta-label">Avg Engagement</span>
+                        <span class="meta-value">{stats['avg_engagement_rate']:.2f}%</span>
+                    </div>
+                    <div class="meta-item">
+                        <span class="meta-label">Total Views</span>
+                        <span class="meta-value">{format_number(stats['total_views'])}</span>
+                    </div>
+                    <div class="meta-item">
+                        <span class="meta-label">Total Likes</span>
+                        <span class="meta-value">{format_number(stats['total_likes'])}</span>
+                    </div>
+                </div>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Rank</th>
+                        <th>Song</th>
+                        <th>Artist</th>
+                        <th>Views</th>
+                        <th>Likes</th>
+                        <th>Comments</th>
+                        <th>Shares</th>
+                        <th>Engagement</th>
+                        <th>Link</th>
+                    </tr>
+                </thead>
+                <tbody>
+''')
+        
+        # Show all videos for this account
+        for j, video in enumerate(stats['videos'], 1):
+            engagement_class_video = get_engagement_class(video['engagement_rate'])
+            song_title = video.get('original_song', video.get('song', 'Unknown'))
+            song_artist = video.get('original_artist', video.get('artist', 'Unknown'))
+            
+            parts.append(f'''                    <tr>
+                        <td class="video-rank">#{j}</td>
+                        <td class="account-name">{song_title}</td>
+                        <td class="account-name">{song_artist}</td>
+                        <td class="metric-value">{format_number(video['views'])}</td>
+                        <td class="metric-value">{format_number(video['likes'])}</td>
+                        <td class="metric-value">{format_number(video['comments'])}</td>
+                        <td class="metric-value">{format_number(video['shares'])}</td>
+                        <td><span class="engagement-badge {engagement_class_video}">{video['engagement_rate']:.2f}%</span></td>
+                        <td><a href="{video['url']}" class="video-link" target="_blank">View</a></td>
+                    </tr>
+''')
+        
+        parts.append('''                </tbody>
+            </table>
+        </div>
+''')
+
+    return ''.join(parts)
+
 def generate_html(sound_stats, all_videos):
     """Generate modern, clean HTML report with earth tones and tabs"""
     sorted_sounds = sorted(sound_stats.items(), key=lambda x: x[1]['total_views'], reverse=True)  # Sort by total views
@@ -495,6 +671,16 @@ def generate_html(sound_stats, all_videos):
     account_stats = aggregate_by_account(all_videos, sound_stats)
     sorted_accounts = sorted(account_stats.items(), key=lambda x: x[1]['total_views'], reverse=True)
 
+    # Resolve album art up front so the tab renderers only format strings
+    art_map = {}
+    for sound_key, stats in sorted_sounds:
+        try:
+            art_path = fetch_album_art.get_album_art(stats['song'], stats['artist'])
+            if art_path:
+                art_map[sound_key] = fetch_album_art.get_relative_image_path(art_path)
+        except:
+            pass
+
     html = f'''<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -988,99 +1174,15 @@ def generate_html(sound_stats, all_videos):
         </div>
 '''
 
-    for i, (sound_key, stats) in enumerate(sorted_sounds, 1):
-        engagement_class = get_engagement_class(stats['avg_engagement_rate'])
-        
-        # Get album art path
-        album_art_path = None
-        try:
-            art_path = fetch_album_art.get_album_art(stats['song'], stats['artist'])
-            if art_path:
-                album_art_path = fetch_album_art.get_relative_image_path(art_path)
-        except:
-            pass
-        
-        # Build album art HTML
-        album_art_html = ''
-        if album_art_path:
-            album_art_html = f'<img src="{album_art_path}" alt="{stats["song"]} - {stats["artist"]}" class="album-art">'
-        
-        html += f'''
-        <div class="sound-section">
-            <div class="sound-header">
-                <div class="sound-title-row">
-                    <span class="sound-rank">{i}</span>
-                    <div class="album-art-container">
-                        {album_art_html}
-                        <div class="sound-info">
-                            <div class="sound-title">{stats['song']}</div>
-                            <div class="sound-artist">{stats['artist']}</div>
-                        </div>
-                    </div>
-                </div>
-                <div class="sound-meta">
-                    <div class="meta-item">
-                        <span class="meta-label">Total Uses</span>
-                        <span class="meta-value">{stats['total_uses']}</span>
-                    </div>
-                    <div class="meta-item">
-                        <span class="meta-label">Avg Views</span>
-                        <span class="meta-value">{format_number(stats['avg_views'])}</span>
-                    </div>
-                    <div class="meta-item">
-                        <span class="meta-label">Avg Engagement</span>
-                        <span class="meta-value">{stats['avg_engagement_rate']:.2f}%</span>
-                    </div>
-                    <div class="meta-item">
-                        <span class="meta-label">Total Views</span>
-                        <span class="meta-value">{format_number(stats['total_views'])}</span>
-                    </div>
-                </div>
-                <div class="accounts-used">
-                    <div class="accounts-label">Used by {len(stats['accounts'])} account(s):</div>
-                    <div class="account-tags">
-'''
-
-        for account in stats['accounts']:
-            html += f'                        <span class="account-tag">{account}</span>\n'
-
-        html += '''                    </div>
-                </div>
-            </div>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Rank</th>
-                        <th>Account</th>
-                        <th>Views</th>
-                        <th>Likes</th>
-                        <th>Comments</th>
-                        <th>Shares</th>
-                        <th>Engagement</th>
-                        <th>Link</th>
-                    </tr>
-                </thead>
-                <tbody>
-'''
+    # Render both tabs concurrently - they share no data and the work is
+    # almost entirely C-level string formatting, so the GIL is rarely held long
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sounds_future = executor.submit(_render_sounds_tab, sorted_sounds, art_map)
+        accounts_future = executor.submit(_render_accounts_tab, sorted_accounts)
+        sounds_html = sounds_future.result()
+        accounts_html = accounts_future.result()
 
-        for j, video in enumerate(stats['videos'][:10], 1):
-            engagement_class_video = get_engagement_class(video['engagement_rate'])
-            html += f'''                    <tr>
-                        <td class="video-rank">#{j}</td>
-                        <td class="account-name">{video['account']}</td>
-                        <td class="metric-value">{format_number(video['views'])}</td>
-                        <td class="metric-value">{format_number(video['likes'])}</td>
-                        <td class="metric-value">{format_number(video['comments'])}</td>
-                        <td class="metric-value">{format_number(video['shares'])}</td>
-                        <td><span class="engagement-badge {engagement_class_video}">{video['engagement_rate']:.2f}%</span></td>
-                        <td><a href="{video['url']}" class="video-link" target="_blank">View</a></td>
-                    </tr>
-'''
-
-        html += '''                </tbody>
-            </table>
-        </div>
-'''
+    html += sounds_html
 
     # Close sounds tab and start accounts tab
     html += '''
@@ -1090,86 +1192,9 @@ def generate_html(sound_stats, all_videos):
         <!-- Accounts Tab -->
         <div id="accounts-tab" class="tab-content">
 '''
-    
-    # Generate account sections
-    for account, stats in sorted_accounts:
-        html += f'''
-        <div class="sound-section">
-            <div class="sound-header">
-                <div class="sound-title-row">
-                    <div class="sound-info">
-                        <div class="sound-title">{account}</div>
-                        <div class="sound-artist">Account Performance</div>
-                    </div>
-                </div>
-                <div class="sound-meta">
-                    <div class="meta-item">
-                        <span class="meta-label">Total Videos</span>
-                        <span class="meta-value">{stats['total_videos']}</span>
-                    </div>
-                    <div class="meta-item">
-                        <span class="meta-label">Unique Sounds</span>
-                        <span class="meta-value">{stats['unique_sounds_count']}</span>
-                    </div>
-                    <div class="meta-item">
-                        <span class="meta-label">Avg Views</span>
-                        <span class="meta-value">{format_number(stats['avg_views'])}</span>
-                    </div>
-                    <div class="meta-item">
-                        <span class="meta-label">Avg Engagement</span>
-                        <span class="meta-value">{stats['avg_engagement_rate']:.2f}%</span>
-                    </div>
-                    <div class="meta-item">
-                        <span class="meta-label">Total Views</span>
-                        <span class="meta-value">{format_number(stats['total_views'])}</span>
-                    </div>
-                    <div class="meta-item">
-                        <span class="meta-label">Total Likes</span>
-                        <span class="meta-value">{format_number(stats['total_likes'])}</span>
-                    </div>
-                </div>
-            </div>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Rank</th>
-                        <th>Song</th>
-                        <th>Artist</th>
-                        <th>Views</th>
-                        <th>Likes</th>
-                        <th>Comments</th>
-                        <th>Shares</th>
-                        <th>Engagement</th>
-                        <th>Link</th>
-                    </tr>
-                </thead>
-                <tbody>
-'''
-        
-        # Show all videos for this account
-        for j, video in enumerate(stats['videos'], 1):
-            engagement_class_video = get_engagement_class(video['engagement_rate'])
-            song_title = video.get('original_song', video.get('song', 'Unknown'))
-            song_artist = video.get('original_artist', video.get('artist', 'Unknown'))
-            
-            html += f'''                    <tr>
-                        <td class="video-rank">#{j}</td>
-                        <td class="account-name">{song_title}</td>
-                        <td class="account-name">{song_artist}</td>
-                        <td class="metric-value">{format_number(video['views'])}</td>
-                        <td class="metric-value">{format_number(video['likes'])}</td>
-                        <td class="metric-value">{format_number(video['comments'])}</td>
-                        <td class="metric-value">{format_number(video['shares'])}</td>
-                        <td><span class="engagement-badge {engagement_class_video}">{video['engagement_rate']:.2f}%</span></td>
-                        <td><a href="{video['url']}" class="video-link" target="_blank">View</a></td>
-                    </tr>
-'''
-        
-        html += '''                </tbody>
-            </table>
-        </div>
-'''
-    
+
+    html += accounts_html
+
     html += '''
         </div>
         <!-- End Accounts Tab -->
@@ -7,6 +7,9 @@ Creates a separate CSV file for each song containing all video instances where i
 import subprocess
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import attrgetter
 import os
 import sys
 import json
@@ -21,27 +24,106 @@ except ImportError:
     print("ERROR: config.py not found. Please create config.py with your account configuration.")
     sys.exit(1)
 
+# Use orjson for the per-line yt-dlp decode when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Import CSV generator utility
-from utils.csv_generator import generate_csv_files_from_videos, sanitize_filename
+from utils.csv_generator import generate_csv_files_from_groups, sanitize_filename
+from yt_dlp_common import iter_yt_dlp_lines
 
 # Use accounts from config
 ACCOUNTS = config.ACCOUNTS
 
+MUSIC_ID_WORKERS = 16  # Parallel yt-dlp lookups when resolving music IDs
+
+SCRAPE_TIMEOUT = 300  # Seconds before a stuck account listing scan is killed
+
+# Listing scan prints only the fields parse_video_data_from_json reads, as one JSON
+# object per line; full --dump-json detail is fetched later only for videos_to_check
+FLAT_LISTING_TEMPLATE = (
+    '%(.{webpage_url,url,view_count,like_count,comment_count,repost_count,'
+    'upload_date,track,artist,artists})j'
+)
+
+# Precompiled patterns for the normalize/extract helpers (called per video)
+_RE_VERSION = re.compile(r'\s*\([^)]*version[^)]*\)', re.IGNORECASE)
+_RE_REMIX = re.compile(r'\s*\([^)]*remix[^)]*\)', re.IGNORECASE)
+_RE_EDIT = re.compile(r'\s*\([^)]*edit[^)]*\)', re.IGNORECASE)
+_RE_MUSIC_ID_Q = re.compile(r'-(\d+)(?:\?|$|&)')
+_RE_MUSIC_ID_END = re.compile(r'-(\d+)$')
+_RE_NON_SLUG = re.compile(r'[^\w\s-]')
+_RE_MUSIC_ID_KEY = re.compile(r'music[_\-]?id', re.IGNORECASE)
+_RE_LEADING_DIGITS = re.compile(r'\d+')
+
+_MUSIC_URL_PREFIX = 'https://www.tiktok.com/music/'
+
+# Translation table deleting every ASCII char _RE_NON_SLUG would remove
+_SLUG_TABLE = dict.fromkeys(i for i in range(128) if _RE_NON_SLUG.match(chr(i)))
+
+class Video:
+    """A scraped TikTok video; slotted to keep thousands of records light and fast to read"""
+    FIELDS = (
+        'account', 'url', 'views', 'likes', 'comments', 'shares', 'upload_date',
+        'song', 'artist', 'original_song', 'original_artist',
+        'music_link', 'music_id', 'engagement_rate', 'sound_key',
+    )
+    __slots__ = tuple(name for name in FIELDS if name != 'music_link') + ('_music_link', 'clean_music_link')
+
+    def __init__(self, account, url, views, likes, comments, shares, upload_date, song, artist):
+        self.account = account
+        self.url = url
+        self.views = views
+        self.likes = likes
+        self.comments = comments
+        self.shares = shares
+        self.upload_date = upload_date
+        self.song = song
+        self.artist = artist
+        self.original_song = song
+        self.original_artist = artist
+        self.music_link = None
+        self.music_id = None
+        self.engagement_rate = 0
+        self.sound_key = f"{song} - {artist}"
+
+    @property
+    def music_link(self):
+        return self._music_link
+
+    @music_link.setter
+    def music_link(self, value):
+        # Keep the query-stripped form alongside so filter passes never re-split it
+        self._music_link = value
+        self.clean_music_link = value.split('?')[0] if value else None
+
+    def to_dict(self):
+        """Plain-dict form expected by utils.csv_generator"""
+        row = {name: getattr(self, name) for name in self.FIELDS}
+        row['song_title'] = self.song
+        row['artist_name'] = self.artist
+        return row
+
+@lru_cache(maxsize=8192)
 def normalize_song_title(title):
     """Normalize song title to combine similar versions"""
     if not title or title == 'Unknown':
         return title
     
     # Remove common version indicators in parentheses
-    title = re.sub(r'\s*\([^)]*version[^)]*\)', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\s*\([^)]*remix[^)]*\)', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\s*\([^)]*edit[^)]*\)', '', title, flags=re.IGNORECASE)
+    title = _RE_VERSION.sub('', title)
+    title = _RE_REMIX.sub('', title)
+    title = _RE_EDIT.sub('', title)
     
     # Remove extra whitespace
     title = ' '.join(title.split())
     
     return title
 
+@lru_cache(maxsize=8192)
 def normalize_artist_name(artist):
     """Normalize artist name"""
     if not artist or artist == 'Unknown':
@@ -56,11 +138,44 @@ def extract_music_id_from_link(music_link):
     """Extract music ID from a TikTok music link"""
     if not music_link:
         return None
-    match = re.search(r'-(\d+)(?:\?|$|&)', music_link)
+    match = _RE_MUSIC_ID_Q.search(music_link)
     if not match:
-        match = re.search(r'-(\d+)$', music_link.split('?')[0])
+        match = _RE_MUSIC_ID_END.search(music_link.split('?')[0])
     return match.group(1) if match else None
 
+def slugify_track(track):
+    """Slugify a track title for a TikTok music URL"""
+    # str.translate covers the common ASCII case; the regex handles Unicode titles
+    slug = track.translate(_SLUG_TABLE) if track.isascii() else _RE_NON_SLUG.sub('', track)
+    return slug.strip().replace(' ', '-')
+
+def _find_music_urls(obj):
+    """Yield TikTok music URLs found in a decoded yt-dlp JSON document, depth-first"""
+    if isinstance(obj, str):
+        start = obj.find(_MUSIC_URL_PREFIX)
+        if start != -1:
+            yield obj[start:].split('"')[0]
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _find_music_urls(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _find_music_urls(value)
+
+def _find_music_ids(obj):
+    """Yield numeric music_id / musicId values found in a decoded yt-dlp JSON document"""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if _RE_MUSIC_ID_KEY.fullmatch(key):
+                match = _RE_LEADING_DIGITS.match(str(value)) if isinstance(value, (str, int)) else None
+                if match:
+                    yield match.group(0)
+                    continue
+            yield from _find_music_ids(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _find_music_ids(value)
+
 def get_music_id_from_video_url(video_url):
     """Fetch full video details to get the actual music ID"""
     try:
@@ -69,23 +184,21 @@ def get_music_id_from_video_url(video_url):
         
         if result.returncode == 0 and result.stdout:
             data = json.loads(result.stdout)
-            full_json_str = json.dumps(data)
             
             # Search for music URL in JSON
-            music_urls = re.findall(r'https://www\.tiktok\.com/music/[^\"]+', full_json_str)
-            if music_urls:
-                music_link = music_urls[0].split('?')[0]
+            music_url = next(_find_music_urls(data), None)
+            if music_url:
+                music_link = music_url.split('?')[0]
                 music_id = extract_music_id_from_link(music_link)
                 if music_id:
                     return music_id, music_link
             
             # Try to find music_id directly
-            music_id_match = re.search(r'\"music[_\-]?id\"\s*:\s*\"?(\d+)\"?', full_json_str, re.IGNORECASE)
-            if music_id_match:
-                music_id = music_id_match.group(1)
+            music_id = next(_find_music_ids(data), None)
+            if music_id:
                 track = data.get('track', '')
                 if track:
-                    track_slug = re.sub(r'[^\w\s-]', '', track).strip().replace(' ', '-')
+                    track_slug = slugify_track(track)
                     music_link = f"https://www.tiktok.com/music/{track_slug}-{music_id}"
                 else:
                     music_link = f"https://www.tiktok.com/music/original-sound-{music_id}"
@@ -104,20 +217,20 @@ def load_music_links_from_csv():
         return None
     
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            for line in lines[1:]:  # Skip header
-                parts = line.split(',')
-                if len(parts) >= 9:
-                    artist = parts[0].strip()
-                    song = parts[7].strip()
-                    song_link = parts[8].strip()
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
+            for row in reader:
+                if len(row) >= 9:
+                    artist = row[0].strip()
+                    song = row[7].strip()
+                    song_link = row[8].strip()
                     
                     if artist and song and song_link and 'tiktok.com/music/' in song_link:
                         # Extract music ID from link
-                        match = re.search(r'-(\d+)(?:\?|$|&)', song_link)
+                        match = _RE_MUSIC_ID_Q.search(song_link)
                         if not match:
-                            match = re.search(r'-(\d+)$', song_link.split('?')[0])
+                            match = _RE_MUSIC_ID_END.search(song_link.split('?')[0])
                         
                         if match:
                             music_id = match.group(1)
@@ -133,32 +246,39 @@ def load_music_links_from_csv():
     
     return music_links if music_links else None
 
-def construct_possible_music_links(track_name, artist_name, music_links_dict):
+def build_artist_index(music_links):
+    """Index CSV music links by normalized artist -> [(normalized_song, music_id)]"""
+    by_artist = defaultdict(list)
+    for music_id, info in music_links.items():
+        csv_song = normalize_song_title(info['song']).lower()
+        csv_artist = normalize_artist_name(info['artist']).lower()
+        by_artist[csv_artist].append((csv_song, music_id))
+    return by_artist
+
+def construct_possible_music_links(track_name, artist_name, music_links_dict, by_artist=None):
     """Match by song name and artist to find the music ID from CSV"""
     if not track_name or track_name == 'Unknown':
         return []
     
+    if by_artist is None:
+        by_artist = build_artist_index(music_links_dict)
+    
     track_normalized = normalize_song_title(track_name).lower()
     artist_normalized = normalize_artist_name(artist_name).lower()
     
+    # Only entries by the same artist can match, so scan just that bucket
     possible_matches = []
-    for music_id, info in music_links_dict.items():
-        csv_song = normalize_song_title(info['song']).lower()
-        csv_artist = normalize_artist_name(info['artist']).lower()
-        
-        if track_normalized == csv_song and artist_normalized == csv_artist:
-            possible_matches.append((music_id, info['link']))
-        elif track_normalized.startswith(csv_song) or csv_song.startswith(track_normalized):
-            if artist_normalized == csv_artist:
-                possible_matches.append((music_id, info['link']))
+    for csv_song, music_id in by_artist.get(artist_normalized, ()):
+        if track_normalized == csv_song or track_normalized.startswith(csv_song) or csv_song.startswith(track_normalized):
+            possible_matches.append((music_id, music_links_dict[music_id]['link']))
     
     return possible_matches
 
-def should_filter_song(video, music_links=None):
+def should_filter_song(video, music_links=None, by_artist=None, links_by_clean=None):
     """Check if a song should be filtered out based on music link matching"""
-    artist = video.get('original_artist', video.get('artist', ''))
-    song = video.get('original_song', video.get('song', ''))
-    sound_key = video.get('sound_key', f"{song} - {artist}")
+    artist = video.original_artist
+    song = video.original_song
+    sound_key = video.sound_key
     
     # Check filtered artists
     if artist in config.FILTERED_ARTISTS:
@@ -172,24 +292,24 @@ def should_filter_song(video, music_links=None):
     
     # Check music links whitelist if enabled
     if music_links is not None:
-        music_id = video.get('music_id')
-        music_link = video.get('music_link')
+        music_id = video.music_id
+        clean_link = video.clean_music_link
         
         if music_id and music_id in music_links:
             return False
         
-        if music_link:
-            clean_link = music_link.split('?')[0]
-            for mid, info in music_links.items():
-                if info['link'] == clean_link:
-                    return False
+        if clean_link:
+            if links_by_clean is None:
+                links_by_clean = {info['link'] for info in music_links.values()}
+            if clean_link in links_by_clean:
+                return False
         
         # Try to match by song name and artist
-        possible_matches = construct_possible_music_links(song, artist, music_links)
+        possible_matches = construct_possible_music_links(song, artist, music_links, by_artist)
         if possible_matches:
             matched_id, matched_link = possible_matches[0]
-            video['music_id'] = matched_id
-            video['music_link'] = matched_link
+            video.music_id = matched_id
+            video.music_link = matched_link
             return False
         
         return True
@@ -197,57 +317,54 @@ def should_filter_song(video, music_links=None):
     return False
 
 def parse_video_data_from_json(json_data, account):
-    """Parse video data directly from yt-dlp JSON output"""
+    """Parse video data directly from yt-dlp JSON output (a string or an iterable of lines)"""
     videos = []
     
-    for line in json_data.strip().split('\n'):
-        if not line:
+    if isinstance(json_data, (str, bytes)):
+        json_data = json_data.splitlines()
+    
+    for line in json_data:
+        if not line.strip():
             continue
         try:
-            video_data = json.loads(line)
+            video_data = _json_loads(line)
             
             track = video_data.get('track', '')
             artist = video_data.get('artist', '') or (video_data.get('artists', [])[0] if video_data.get('artists') else '')
             
             video_url = video_data.get('webpage_url') or video_data.get('url', '')
             
-            video = {
-                'account': account,
-                'url': video_url,
-                'views': video_data.get('view_count', 0),
-                'likes': video_data.get('like_count', 0),
-                'comments': video_data.get('comment_count', 0),
-                'shares': video_data.get('repost_count', 0),
-                'upload_date': video_data.get('upload_date', ''),
-                'song': track or 'Unknown',
-                'artist': artist or 'Unknown',
-                'original_song': track or 'Unknown',
-                'original_artist': artist or 'Unknown',
-                'music_link': None,
-                'music_id': None,
-            }
+            video = Video(
+                account=account,
+                url=video_url,
+                views=video_data.get('view_count', 0),
+                likes=video_data.get('like_count', 0),
+                comments=video_data.get('comment_count', 0),
+                shares=video_data.get('repost_count', 0),
+                upload_date=video_data.get('upload_date', ''),
+                song=track or 'Unknown',
+                artist=artist or 'Unknown',
+            )
             
             # Calculate engagement rate
-            if video['views'] > 0:
-                video['engagement_rate'] = ((video['likes'] + video['comments'] + video['shares']) / video['views']) * 100
-            else:
-                video['engagement_rate'] = 0
+            if video.views > 0:
+                video.engagement_rate = ((video.likes + video.comments + video.shares) / video.views) * 100
             
             # Format upload date
-            upload_date = video['upload_date']
+            upload_date = video.upload_date
             if upload_date:
                 try:
                     upload_datetime = datetime.strptime(upload_date, '%Y%m%d')
-                    video['upload_date'] = upload_datetime.strftime('%Y-%m-%d')
+                    video.upload_date = upload_datetime.strftime('%Y-%m-%d')
                 except:
-                    video['upload_date'] = upload_date
+                    video.upload_date = upload_date
             else:
-                video['upload_date'] = 'Unknown'
+                video.upload_date = 'Unknown'
             
             # Create sound key
-            normalized_song = normalize_song_title(video['song'])
-            normalized_artist = normalize_artist_name(video['artist'])
-            video['sound_key'] = f"{normalized_song} - {normalized_artist}"
+            normalized_song = normalize_song_title(video.song)
+            normalized_artist = normalize_artist_name(video.artist)
+            video.sound_key = f"{normalized_song} - {normalized_artist}"
             
             videos.append(video)
             
@@ -256,6 +373,34 @@ def parse_video_data_from_json(json_data, account):
     
     return videos
 
+def scrape_account(account):
+    """Scrape a single TikTok account via yt-dlp JSON and return its parsed videos"""
+    print(f"Processing {account}...")
+    
+    # Cheap flat listing scan - no per-video detail pages are requested here
+    profile_url = f"https://www.tiktok.com/{account}"
+    cmd = [
+        config.YT_DLP_CMD,
+        '--flat-playlist',
+        '--print', FLAT_LISTING_TEMPLATE,
+        '--playlist-end', str(config.DEFAULT_VIDEO_LIMIT * 3),
+        profile_url
+    ]
+    
+    # Parse lines as yt-dlp emits them rather than buffering the whole stdout
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    try:
+        videos = parse_video_data_from_json(iter_yt_dlp_lines(cmd, SCRAPE_TIMEOUT, cwd=base_dir), account)
+    except subprocess.TimeoutExpired:
+        print(f"  ⚠️  Error scraping {account}: yt-dlp killed after {SCRAPE_TIMEOUT}s timeout")
+        return []
+    except subprocess.CalledProcessError as e:
+        print(f"  ⚠️  Error scraping {account}: {e.stderr.decode('utf-8', errors='replace')[:200]}")
+        return []
+    
+    print(f"  Found {len(videos)} videos for {account}")
+    return videos
+
 def aggregate_by_sound(all_videos):
     """Aggregate videos by sound/song"""
     # Load music links from CSV
@@ -269,53 +414,84 @@ def aggregate_by_sound(all_videos):
         'artist': ''
     })
 
-    # First pass: Try to get music IDs for videos that might match
-    print(f"  🔍 Extracting music IDs from videos (this may take a moment)...")
-    videos_to_check = []
-    for video in all_videos:
-        song = video.get('original_song', video.get('song', ''))
-        artist = video.get('original_artist', video.get('artist', ''))
+    # Without a whitelist nothing can match, so skip the music ID phase entirely
+    by_artist = None
+    links_by_clean = None
+    if music_links:
+        # Index the CSV once: by artist so each video only scans its artist's songs,
+        # and by cleaned link for O(1) whitelist membership in should_filter_song
+        by_artist = build_artist_index(music_links)
+        links_by_clean = {info['link'] for info in music_links.values()}
+        exact_pairs = frozenset(
+            (csv_artist, csv_song)
+            for csv_artist, entries in by_artist.items()
+            for csv_song, _ in entries
+        )
+
+        # First pass: Try to get music IDs for videos that might match
+        print(f"  🔍 Extracting music IDs from videos (this may take a moment)...")
+        videos_to_check = []
+        for video in all_videos:
+            song = video.original_song
+            artist = video.original_artist
         
-        might_match = False
-        if music_links:
-            for mid, info in music_links.items():
-                csv_song = normalize_song_title(info['song']).lower()
-                csv_artist = normalize_artist_name(info['artist']).lower()
-                song_norm = normalize_song_title(song).lower()
-                artist_norm = normalize_artist_name(artist).lower()
-                
-                if (song_norm == csv_song or song_norm.startswith(csv_song) or csv_song.startswith(song_norm)):
-                    if artist_norm == csv_artist:
+            might_match = False
+            song_norm = normalize_song_title(song).lower()
+            artist_norm = normalize_artist_name(artist).lower()
+            # Exact hits are the common case - only prefix-scan the artist bucket on a miss
+            if (artist_norm, song_norm) in exact_pairs:
+                might_match = True
+            else:
+                for csv_song, mid in by_artist.get(artist_norm, ()):
+                    if song_norm.startswith(csv_song) or csv_song.startswith(song_norm):
                         might_match = True
                         break
         
-        if might_match and not video.get('music_id'):
-            videos_to_check.append(video)
-    
-    # Fetch music IDs for potential matches
-    print(f"  📥 Fetching music IDs for {min(len(videos_to_check), 200)} potential matches...")
-    for i, video in enumerate(videos_to_check[:200]):
-        if i % 50 == 0 and i > 0:
-            print(f"    Progress: {i}/{min(len(videos_to_check), 200)} videos checked...")
-        music_id, music_link = get_music_id_from_video_url(video['url'])
-        if music_id:
-            video['music_id'] = music_id
-            video['music_link'] = music_link
+            if might_match and not video.music_id:
+                videos_to_check.append(video)
+    
+        # Fetch music IDs for potential matches. Videos sharing a (song, artist) pair -
+        # including duplicate URLs - share one lookup, whose result is reused for all
+        videos_by_pair = defaultdict(list)
+        for video in videos_to_check:
+            pair = (video.original_song, video.original_artist)
+            videos_by_pair[pair].append(video)
+        pairs_to_fetch = list(videos_by_pair.items())[:200]
+    
+        # Each lookup is a network-bound yt-dlp call, so run them concurrently
+        print(f"  📥 Fetching music IDs for {len(pairs_to_fetch)} potential matches ({len(videos_to_check)} videos)...")
+        music_id_cache = {}
+        with ThreadPoolExecutor(max_workers=MUSIC_ID_WORKERS) as executor:
+            future_to_pair = {
+                executor.submit(get_music_id_from_video_url, videos[0].url): pair
+                for pair, videos in pairs_to_fetch
+            }
+            for i, future in enumerate(as_completed(future_to_pair), 1):
+                if i % 50 == 0:
+                    print(f"    Progress: {i}/{len(future_to_pair)} lookups done...")
+                music_id_cache[future_to_pair[future]] = future.result()
     
+        for pair, videos in pairs_to_fetch:
+            music_id, music_link = music_id_cache[pair]
+            if music_id:
+                for video in videos:
+                    video.music_id = music_id
+                    video.music_link = music_link
+
     # Second pass: Filter videos based on music links
     for video in all_videos:
         # Skip filtered songs
-        if should_filter_song(video, music_links):
+        if should_filter_song(video, music_links, by_artist, links_by_clean):
             continue
             
-        sound_key = video['sound_key']
+        sound_key = video.sound_key
         sound_stats[sound_key]['videos'].append(video)
-        sound_stats[sound_key]['song'] = video.get('original_song', video['song'])
-        sound_stats[sound_key]['artist'] = video.get('original_artist', video['artist'])
+        sound_stats[sound_key]['song'] = video.original_song
+        sound_stats[sound_key]['artist'] = video.original_artist
 
     # Sort videos within each song by views (highest first)
     for sound_key, stats in sound_stats.items():
-        stats['videos'].sort(key=lambda x: x['views'], reverse=True)
+        stats['videos'].sort(key=attrgetter('views'), reverse=True)
 
     return sound_stats
 
@@ -323,19 +499,19 @@ def aggregate_by_sound(all_videos):
 # This function is kept for backward compatibility but uses the utility module
 def generate_csv_files(sound_stats, output_dir):
     """Generate CSV file for each song - uses utility module"""
-    # Convert sound_stats format to list of videos
-    all_videos = []
-    for sound_key, stats in sound_stats.items():
-        for video in stats['videos']:
-            # Ensure video has song_title and artist_name for compatibility
-            if 'song_title' not in video:
-                video['song_title'] = video.get('song', '')
-            if 'artist_name' not in video:
-                video['artist_name'] = video.get('artist', '')
-            all_videos.append(video)
+    # sound_stats is already grouped, so stream one song at a time to the utility
+    # instead of flattening every video into a list for it to regroup
+    groups = (
+        (sound_key, {
+            'song': stats['song'],
+            'artist': stats['artist'],
+            'videos': [video.to_dict() for video in stats['videos']],
+        })
+        for sound_key, stats in sorted(sound_stats.items())
+    )
     
     # Use utility function
-    csv_files_created, total_rows, file_list = generate_csv_files_from_videos(all_videos, output_dir)
+    csv_files_created, total_rows, file_list = generate_csv_files_from_groups(groups, output_dir)
     
     # Print individual file creation messages
     for file_info in file_list:
@@ -353,31 +529,10 @@ def main():
     print("="*80)
     print(f"\nCollecting video data from {len(ACCOUNTS)} accounts...")
 
-    all_videos = []
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    base_dir = script_dir
-
-    for account in ACCOUNTS:
-        print(f"Processing {account}...")
-        
-        # Get video data directly from yt-dlp JSON
-        profile_url = f"https://www.tiktok.com/{account}"
-        cmd = [
-            config.YT_DLP_CMD,
-            '--flat-playlist',
-            '--dump-json',
-            '--playlist-end', str(config.DEFAULT_VIDEO_LIMIT * 3),
-            profile_url
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=base_dir, timeout=300)
-        
-        if result.returncode == 0:
-            videos = parse_video_data_from_json(result.stdout, account)
-            all_videos.extend(videos)
-            print(f"  Found {len(videos)} videos")
-        else:
-            print(f"  ⚠️  Error scraping {account}: {result.stderr[:200]}")
+    # Accounts are independent network-bound scrapes, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(ACCOUNTS))) as executor:
+        results = list(executor.map(scrape_account, ACCOUNTS))
+    all_videos = [video for videos in results for video in videos]
 
     print(f"\nTotal videos scraped: {len(all_videos)}")
 
@@ -9,8 +9,11 @@ import subprocess
 import json
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
 from openpyxl.utils import get_column_letter
 
 # Import configuration
@@ -20,10 +23,27 @@ except ImportError:
     print("ERROR: config.py not found. Please create config.py with your account configuration.")
     sys.exit(1)
 
+# Use orjson for the per-line yt-dlp decode when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Same sound grouping as the CSV report, so versions fold together identically in both
+from generate_song_csvs import normalize_song_title, normalize_artist_name
+from yt_dlp_common import iter_yt_dlp_lines
+
 # Use accounts and exclusive songs from config
 ACCOUNTS = config.ACCOUNTS
 EXCLUSIVE_SONGS = config.EXCLUSIVE_SONGS
 
+# Seconds before a stuck yt-dlp is killed so one account can't stall the pool
+SCRAPE_TIMEOUT = 300
+
+# Characters Excel forbids in sheet names, mapped to their replacements
+_SHEET_SAFE = str.maketrans({'/': '-', '\\': '-', ':': '-', '?': None, '*': None, '[': None, ']': None})
+
 def scrape_account(account):
     """Scrape a single TikTok account using yt-dlp - ALL videos"""
     print(f"Scraping {account}...")
@@ -37,60 +57,65 @@ def scrape_account(account):
         profile_url
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"  ⚠️  Error scraping {account}: {result.stderr.strip()}")
-        return []
-
+    # Parse lines as yt-dlp emits them rather than buffering the whole stdout
     videos = []
-    for line in result.stdout.strip().split('\n'):
-        if line:
-            try:
-                video_data = json.loads(line)
-
-                # Extract upload date
-                upload_date = video_data.get('upload_date', '')
-                if upload_date:
-                    try:
-                        upload_datetime = datetime.strptime(upload_date, '%Y%m%d')
-
-                        # Filter for configured cutoff date
-                        if upload_datetime < config.CUTOFF_DATE:
-                            continue
-
-                        formatted_date = upload_datetime.strftime('%Y-%m-%d')
-                    except:
-                        formatted_date = upload_date
-                else:
-                    formatted_date = 'Unknown'
-                    continue  # Skip if no date
-
-                song_title = video_data.get('track', '') or 'Unknown'
-                song_artist = video_data.get('artist', '') or video_data.get('creator', '') or 'Unknown'
-                sound_key = f"{song_title} - {song_artist}"
-
-                # Skip exclusive songs
-                if sound_key in EXCLUSIVE_SONGS:
+    try:
+        for line in iter_yt_dlp_lines(cmd, SCRAPE_TIMEOUT):
+            if line.strip():
+                try:
+                    video_data = _json_loads(line)
+
+                    # Extract upload date
+                    upload_date = video_data.get('upload_date', '')
+                    if upload_date:
+                        try:
+                            upload_datetime = datetime.strptime(upload_date, '%Y%m%d')
+
+                            # Filter for configured cutoff date
+                            if upload_datetime < config.CUTOFF_DATE:
+                                continue
+
+                            formatted_date = upload_datetime.strftime('%Y-%m-%d')
+                        except:
+                            formatted_date = upload_date
+                    else:
+                        formatted_date = 'Unknown'
+                        continue  # Skip if no date
+
+                    song_title = video_data.get('track', '') or 'Unknown'
+                    song_artist = video_data.get('artist', '') or video_data.get('creator', '') or 'Unknown'
+
+                    # Skip exclusive songs
+                    if f"{song_title} - {song_artist}" in EXCLUSIVE_SONGS:
+                        continue
+
+                    # Group versions of the same song under one normalized key
+                    sound_key = f"{normalize_song_title(song_title)} - {normalize_artist_name(song_artist)}"
+
+                    video_url = video_data.get('webpage_url') or video_data.get('url', '')
+
+                    videos.append({
+                        'account': account,
+                        'sound_key': sound_key,
+                        'song_title': song_title,
+                        'song_artist': song_artist,
+                        'url': video_url,
+                        'upload_date': formatted_date,
+                        'views': video_data.get('view_count', 0),
+                        'likes': video_data.get('like_count', 0),
+                        'comments': video_data.get('comment_count', 0),
+                        'shares': video_data.get('repost_count', 0)
+                    })
+
+                except json.JSONDecodeError:
                     continue
 
-                video_url = video_data.get('webpage_url') or video_data.get('url', '')
-
-                videos.append({
-                    'account': account,
-                    'sound_key': sound_key,
-                    'song_title': song_title,
-                    'song_artist': song_artist,
-                    'url': video_url,
-                    'upload_date': formatted_date,
-                    'views': video_data.get('view_count', 0),
-                    'likes': video_data.get('like_count', 0),
-                    'comments': video_data.get('comment_count', 0),
-                    'shares': video_data.get('repost_count', 0)
-                })
-
-            except json.JSONDecodeError:
-                continue
+    except subprocess.TimeoutExpired:
+        print(f"  ⚠️  Timeout scraping {account} after {SCRAPE_TIMEOUT}s")
+        return []
+    except subprocess.CalledProcessError as e:
+        print(f"  ⚠️  Error scraping {account}: {e.stderr.decode('utf-8', errors='replace').strip()}")
+        return []
 
     cutoff_date_str = config.CUTOFF_DATE.strftime('%Y-%m-%d')
     print(f"  ✓ Found {len(videos)} videos (shared songs, from {cutoff_date_str} onwards)")
@@ -98,34 +123,47 @@ def scrape_account(account):
 
 def create_excel_workbook(videos_by_song):
     """Create Excel workbook with separate sheet for each song"""
-    wb = openpyxl.Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    # Write-only mode streams rows out instead of building the full cell grid
+    wb = openpyxl.Workbook(write_only=True)
+
+    # Register the header style once and share it across every sheet
+    header_style = NamedStyle(name='song_header')
+    header_style.fill = PatternFill(start_color='4F81BD', end_color='4F81BD', fill_type='solid')
+    header_style.font = Font(bold=True, color='FFFFFF')
+    header_style.alignment = Alignment(horizontal='center', vertical='center')
+    wb.add_named_style(header_style)
 
     # Sort songs alphabetically
-    sorted_songs = sorted(videos_by_song.items(), key=lambda x: x[0])
+    sorted_songs = sorted(videos_by_song.items(), key=itemgetter(0))
 
     for song_key, videos in sorted_songs:
         # Create sheet name (max 31 chars for Excel)
         sheet_name = song_key[:31] if len(song_key) <= 31 else song_key[:28] + "..."
 
         # Make sheet name Excel-safe (no special chars)
-        sheet_name = sheet_name.replace('/', '-').replace('\\', '-').replace('?', '').replace('*', '').replace('[', '').replace(']', '').replace(':', '-')
+        sheet_name = sheet_name.translate(_SHEET_SAFE)
 
         ws = wb.create_sheet(title=sheet_name)
 
+        # Column widths and frozen header must be set before any rows are written
+        ws.column_dimensions['A'].width = 30  # Account
+        ws.column_dimensions['B'].width = 50  # URL
+        ws.column_dimensions['C'].width = 15  # Date
+        ws.column_dimensions['D'].width = 12  # Views
+        ws.column_dimensions['E'].width = 12  # Likes
+        ws.column_dimensions['F'].width = 12  # Comments
+        ws.column_dimensions['G'].width = 12  # Shares
+        ws.freeze_panes = 'A2'
+
         # Header row
         headers = ['Account', 'TikTok URL', 'Upload Date', 'Views', 'Likes', 'Comments', 'Shares']
-        ws.append(headers)
 
-        # Style header row
-        header_fill = PatternFill(start_color='4F81BD', end_color='4F81BD', fill_type='solid')
-        header_font = Font(bold=True, color='FFFFFF')
-
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = 'song_header'
+            header_cells.append(cell)
+        ws.append(header_cells)
 
         # Add video data
         for video in videos:
@@ -139,18 +177,6 @@ def create_excel_workbook(videos_by_song):
                 video['shares']
             ])
 
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30  # Account
-        ws.column_dimensions['B'].width = 50  # URL
-        ws.column_dimensions['C'].width = 15  # Date
-        ws.column_dimensions['D'].width = 12  # Views
-        ws.column_dimensions['E'].width = 12  # Likes
-        ws.column_dimensions['F'].width = 12  # Comments
-        ws.column_dimensions['G'].width = 12  # Shares
-
-        # Freeze header row
-        ws.freeze_panes = 'A2'
-
     return wb
 
 def main():
@@ -160,11 +186,10 @@ def main():
     cutoff_date_str = config.CUTOFF_DATE.strftime('%Y-%m-%d')
     print(f"\nScraping {len(ACCOUNTS)} accounts for shared song usage (from {cutoff_date_str} onwards)...\n")
 
-    all_videos = []
-
-    for account in ACCOUNTS:
-        videos = scrape_account(account)
-        all_videos.extend(videos)
+    # Accounts are independent network-bound scrapes, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(ACCOUNTS)))) as executor:
+        results = list(executor.map(scrape_account, ACCOUNTS))
+    all_videos = [video for videos in results for video in videos]
 
     print(f"\n{'='*80}")
     print(f"Total videos collected: {len(all_videos)}")
@@ -181,7 +206,7 @@ def main():
 
     # Sort videos within each song by date (newest first)
     for song_key in videos_by_song:
-        videos_by_song[song_key].sort(key=lambda x: x['upload_date'], reverse=True)
+        videos_by_song[song_key].sort(key=itemgetter('upload_date'), reverse=True)
 
     print(f"Found {len(videos_by_song)} unique shared songs\n")
     print("Creating Excel workbook...")
@@ -10,81 +10,124 @@ Usage:
 """
 
 import argparse
+import bisect
 import csv
+import hashlib
 import json
+import pickle
 import re
 import subprocess
 import sys
-from collections import defaultdict
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from config import ACCOUNTS, PROJECT_ROOT, OUTPUT_DIR
+from tiktok_analyzer import analyze as analyze_account
 
-# Path to clean Warner songs CSV
+# Max accounts scraped concurrently (analyzer work is yt-dlp/network bound)
+MAX_WORKERS = 8
+SCRAPE_TIMEOUT = 300  # Per-account analyzer deadline (yt-dlp listing plus sound ID fetches)
+
+# Scraped accounts are cached here so report re-runs skip the analyzer
+SCRAPE_CACHE_DIR = OUTPUT_DIR / '.cache'
+SCRAPE_CACHE_TTL = 1800  # seconds
+
+# Analyzer upload dates are YYYY-MM-DD (or 'Unknown' when missing)
+_RE_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}$')
+
+# Path to clean Warner songs CSV (and its parsed-set cache, rebuilt when the CSV changes)
 WARNER_CSV = PROJECT_ROOT / 'data' / 'warner_songs_clean.csv'
+WARNER_CACHE = SCRAPE_CACHE_DIR / 'warner_songs.pkl'
+
+# Engagement rate thresholds -> CSS class (>= 10 medium, >= 15 high)
+_ENGAGEMENT_THRESHOLDS = (10, 15)
+_ENGAGEMENT_CLASSES = ('metric-low', 'metric-medium', 'metric-high')
 
 def load_warner_songs():
     """
     Load Warner song list dynamically from clean CSV.
-    Returns set of sound keys in "Song - Artist" format.
+    Returns frozenset of casefolded sound keys in "Song - Artist" format.
     """
-    warner_songs = set()
+    warner_songs = frozenset()
+
+    try:
+        if WARNER_CACHE.exists() and WARNER_CACHE.stat().st_mtime >= WARNER_CSV.stat().st_mtime:
+            warner_songs = pickle.loads(WARNER_CACHE.read_bytes())
+            print(f"✅ Loaded {len(warner_songs)} Warner songs from cache\n")
+            return warner_songs
+    except Exception:
+        pass  # Fall through to the CSV
 
     try:
         with open(WARNER_CSV, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                sound_key = row.get('sound_key', '').strip()
-                if sound_key:
-                    warner_songs.add(sound_key)
+            # Plain reader + column index: no per-row dict for a one-column scan
+            reader = csv.reader(f)
+            idx = next(reader).index('sound_key')
+            # Normalize once here so lookups are case/whitespace insensitive
+            warner_songs = frozenset(
+                sound_key for sound_key in
+                (row[idx].strip().casefold() for row in reader if len(row) > idx)
+                if sound_key
+            )
 
         print(f"✅ Loaded {len(warner_songs)} Warner songs from CSV\n")
     except Exception as e:
         print(f"⚠️  Warning: Could not load Warner songs from CSV: {e}")
         print("   Proceeding without filtering...\n")
+        return warner_songs
+
+    try:
+        SCRAPE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        WARNER_CACHE.write_bytes(pickle.dumps(warner_songs))
+    except OSError:
+        pass  # Cache is best-effort
 
     return warner_songs
 
 # Load Warner songs at module level
 WARNER_SONGS = load_warner_songs()
 
-def scrape_account(username, since_date=None, limit=None):
+def scrape_account(username, since_date=None, limit=None, use_cache=True):
     """
-    Scrape a TikTok account using tiktok_analyzer.py.
+    Scrape a TikTok account using tiktok_analyzer (in-process).
 
     Args:
         username: TikTok username (with @)
         since_date: Only include videos after this date (datetime object)
         limit: Maximum number of videos to scrape (None for no limit)
+        use_cache: Reuse a scrape younger than SCRAPE_CACHE_TTL if present
 
     Returns:
         List of video dictionaries
     """
-    print(f"Scraping {username}...")
-
-    cmd = [
-        'python3',
-        str(PROJECT_ROOT / 'tiktok_analyzer.py'),
-        '--url', username
-    ]
-
-    # Only add limit if specified
-    if limit:
-        cmd.extend(['--limit', str(limit)])
-    else:
-        # Use a high limit to get all videos back to October 1st
-        cmd.extend(['--limit', '1000'])
+    key = hashlib.sha1(f"{username}|{since_date}|{limit}".encode()).hexdigest()
+    cache_file = SCRAPE_CACHE_DIR / f'{key}.json'
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        if use_cache and cache_file.exists() and time.time() - cache_file.stat().st_mtime < SCRAPE_CACHE_TTL:
+            print(f"Using cached scrape for {username}...")
+            videos = json.loads(cache_file.read_text(encoding='utf-8'))
+        else:
+            print(f"Scraping {username}...")
+
+            # Use a high limit to get all videos back to October 1st
+            analyzer_videos = analyze_account(username, limit=limit or 1000,
+                                              timeout=SCRAPE_TIMEOUT, check=True)
 
-        if result.returncode != 0:
-            print(f"  ❌ Error scraping {username}: {result.stderr}")
-            return []
+            # Convert to report records (get ALL videos first)
+            videos = parse_analyzer_videos(analyzer_videos, username, since_date)
 
-        # Parse the output (get ALL videos first)
-        videos = parse_analyzer_output(result.stdout, username, since_date)
+            # Cache before Warner filtering so CSV updates still apply on re-runs
+            # (empty scrapes are usually failures, so don't pin them)
+            if analyzer_videos:
+                SCRAPE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(videos), encoding='utf-8')
 
         # Filter to only Warner songs AFTER scraping
         warner_videos = [v for v in videos if is_warner_song(v)]
@@ -95,94 +138,68 @@ def scrape_account(username, since_date=None, limit=None):
     except subprocess.TimeoutExpired:
         print(f"  ❌ Timeout scraping {username}")
         return []
+    except subprocess.CalledProcessError as e:
+        print(f"  ❌ Error scraping {username}: {e.stderr}")
+        return []
     except Exception as e:
         print(f"  ❌ Exception scraping {username}: {e}")
         return []
 
 
-def parse_analyzer_output(output, username, since_date=None):
-    """Parse tiktok_analyzer.py output into structured data."""
+def parse_analyzer_videos(analyzer_videos, username, since_date=None):
+    """Convert tiktok_analyzer video dicts into report records."""
     videos = []
 
-    # Split by video sections
-    video_sections = re.split(r'VIDEO #\d+', output)
-
-    for section in video_sections[1:]:  # Skip first empty section
-        video = {}
-
-        # Extract URL
-        url_match = re.search(r'URL: (https://www\.tiktok\.com/@[^/]+/video/\d+)', section)
-        if url_match:
-            video['url'] = url_match.group(1)
-            # Extract video ID from URL
-            video_id_match = re.search(r'/video/(\d+)', video['url'])
-            if video_id_match:
-                video['video_id'] = video_id_match.group(1)
-
-        # Extract upload date
-        date_match = re.search(r'Upload Date: (\d{4}-\d{2}-\d{2})', section)
-        if date_match:
-            video['upload_date'] = date_match.group(1)
-            upload_dt = datetime.strptime(video['upload_date'], '%Y-%m-%d')
-
-            # Filter by date if specified
-            if since_date and upload_dt < since_date:
-                continue
-
-        # Extract caption/title
-        caption_match = re.search(r'Title/Caption: (.+?)(?:\n|URL:)', section, re.DOTALL)
-        if caption_match:
-            video['caption'] = caption_match.group(1).strip()
-
-        # Extract metrics
-        views_match = re.search(r'Views:\s+[\d.KMB]+\s+\(([,\d]+)\)', section)
-        likes_match = re.search(r'Likes:\s+[\d.KMB]+\s+\(([,\d]+)\)', section)
-        comments_match = re.search(r'Comments:\s+[\d.KMB]+\s+\(([,\d]+)\)', section)
-        shares_match = re.search(r'Shares:\s+[\d.KMB]+\s+\(([,\d]+)\)', section)
-        engagement_match = re.search(r'Engagement Rate: ([\d.]+)%', section)
-
-        if views_match:
-            video['views'] = int(views_match.group(1).replace(',', ''))
-        if likes_match:
-            video['likes'] = int(likes_match.group(1).replace(',', ''))
-        if comments_match:
-            video['comments'] = int(comments_match.group(1).replace(',', ''))
-        if shares_match:
-            video['shares'] = int(shares_match.group(1).replace(',', ''))
-        if engagement_match:
-            video['engagement_rate'] = float(engagement_match.group(1))
-
-        # Extract song info
-        song_match = re.search(r'Song: (.+)', section)
-        artist_match = re.search(r'Artist: (.+)', section)
-
-        if song_match:
-            video['song_title'] = song_match.group(1).strip()
-        if artist_match:
-            video['artist_name'] = artist_match.group(1).strip()
-
-        # Create sound key
-        if 'song_title' in video:
-            if 'artist_name' in video:
-                video['sound_key'] = f"{video['song_title']} - {video['artist_name']}"
-            else:
-                video['sound_key'] = video['song_title']
+    # ISO dates compare correctly as strings, so no per-video strptime
+    since_str = since_date.strftime('%Y-%m-%d') if since_date else None
+
+    for data in analyzer_videos:
+        url = data.get('url')
+        upload_date = data.get('upload_date')
+        if not url or not upload_date or not _RE_ISO_DATE.match(upload_date):
+            continue
+
+        # Filter by date if specified
+        if since_str and upload_date < since_str:
+            continue
+
+        video = {
+            'url': url,
+            'upload_date': upload_date,
+            'caption': (data.get('title') or '')[:80].strip() or '(No caption)',
+            'views': data.get('views') or 0,
+            'likes': data.get('likes') or 0,
+            'comments': data.get('comments') or 0,
+            'shares': data.get('shares') or 0,
+        }
+        if data.get('id'):
+            video['video_id'] = str(data['id'])
+
+        if video['views'] > 0:
+            interactions = video['likes'] + video['comments'] + video['shares']
+            video['engagement_rate'] = round(interactions / video['views'] * 100, 2)
+
+        # Song info (same fallbacks as the analyzer's text report)
+        song_title = data.get('song_title') or ''
+        song_artist = data.get('song_artist') or ''
+        if song_title or song_artist:
+            video['song_title'] = song_title.strip() or 'Unknown'
+            video['artist_name'] = song_artist.strip() or 'Unknown'
+            video['sound_key'] = f"{video['song_title']} - {video['artist_name']}"
         else:
             video['sound_key'] = 'Unknown Sound'
 
         video['account'] = username
-
-        # Only add if we have minimum required data
-        if 'url' in video and 'upload_date' in video:
-            videos.append(video)
+        videos.append(video)
 
     return videos
 
 
-def is_warner_song(video):
+def is_warner_song(video, _is_warner_key=WARNER_SONGS.__contains__):
     """
     Check if a video uses a Warner song.
-    STRICT EXACT matching - only matches sound_key in "Song - Artist" format.
+    Exact matching on sound_key in "Song - Artist" format, ignoring case
+    (parse_analyzer_videos always sets sound_key, already stripped).
 
     Args:
         video: Video dictionary with sound_key
@@ -190,12 +207,12 @@ def is_warner_song(video):
     Returns:
         True if video uses a Warner song, False otherwise
     """
-    sound_key = video.get('sound_key', '')
-
-    # ONLY exact match on sound_key (format: "Song - Artist")
-    return sound_key in WARNER_SONGS
+    # ONLY exact match on sound_key (format: "Song - Artist"), via the
+    # frozenset's bound __contains__ so the per-video check skips global lookups
+    return _is_warner_key(video['sound_key'].casefold())
 
 
+@lru_cache(maxsize=4096)
 def format_number(num):
     """Format number with K/M suffixes."""
     if num >= 1_000_000:
@@ -206,14 +223,15 @@ def format_number(num):
         return str(num)
 
 
-def generate_html_report(accounts_data, output_file):
-    """Generate SHADCN-style HTML report."""
+def write_html_report(f, accounts_data):
+    """Write the SHADCN-style HTML report to an open file, section by section."""
+    write = f.write
 
     # Calculate total statistics
     total_videos = sum(len(videos) for videos in accounts_data.values())
     total_sounds = len(set(v['sound_key'] for videos in accounts_data.values() for v in videos))
 
-    html = f"""<!DOCTYPE html>
+    write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -485,21 +503,23 @@ def generate_html_report(accounts_data, output_file):
                 </div>
             </div>
         </div>
-"""
+""")
 
     # Generate account sections
     for account, videos in sorted(accounts_data.items()):
         if not videos:
             continue
 
-        # Group videos by sound
-        sounds = defaultdict(list)
-        for video in videos:
-            sounds[video['sound_key']].append(video)
+        # Order sounds by video count (ties keep first-seen order), then sort the
+        # videos into that order so groupby can stream each sound's group
+        sound_counts = Counter(video['sound_key'] for video in videos)
+        sound_rank = {sound_key: rank for rank, sound_key in
+                      enumerate(sorted(sound_counts, key=lambda k: -sound_counts[k]))}
+        ordered_videos = sorted(videos, key=lambda v: sound_rank[v['sound_key']])
 
         account_id = account.replace('@', '')
 
-        html += f"""
+        write(f"""
         <div class="account-section">
             <div class="account-header" onclick="toggleAccount('{account_id}')">
                 <div class="account-title">
@@ -509,16 +529,23 @@ def generate_html_report(accounts_data, output_file):
                 <span class="chevron" id="chevron-{account_id}">▼</span>
             </div>
             <div class="account-content" id="content-{account_id}">
-"""
+""")
 
         # Generate sound sections
-        for sound_key, sound_videos in sorted(sounds.items(), key=lambda x: -len(x[1])):
-            # Calculate sound stats
-            total_views = sum(v.get('views', 0) for v in sound_videos)
-            total_likes = sum(v.get('likes', 0) for v in sound_videos)
-            avg_engagement = sum(v.get('engagement_rate', 0) for v in sound_videos) / len(sound_videos)
+        for sound_key, group in groupby(ordered_videos, key=itemgetter('sound_key')):
+            sound_videos = list(group)
+            # Calculate sound stats in one pass
+            total_views = total_likes = total_engagement = 0
+            for v in sound_videos:
+                total_views += v.get('views', 0)
+                total_likes += v.get('likes', 0)
+                total_engagement += v.get('engagement_rate', 0)
+            avg_engagement = total_engagement / len(sound_videos)
+
+            # Sort videos by date (newest first)
+            sorted_videos = sorted(sound_videos, key=lambda x: x.get('upload_date', ''), reverse=True)
 
-            html += f"""
+            write(f"""
                 <div class="sound-group">
                     <div class="sound-header">
                         <div class="sound-title">{sound_key}</div>
@@ -538,14 +565,13 @@ def generate_html_report(accounts_data, output_file):
                             </tr>
                         </thead>
                         <tbody>
-"""
+""")
 
-            # Sort videos by date (newest first)
-            for video in sorted(sound_videos, key=lambda x: x.get('upload_date', ''), reverse=True):
+            for video in sorted_videos:
                 engagement = video.get('engagement_rate', 0)
-                engagement_class = 'metric-high' if engagement >= 15 else 'metric-medium' if engagement >= 10 else 'metric-low'
+                engagement_class = _ENGAGEMENT_CLASSES[bisect.bisect_right(_ENGAGEMENT_THRESHOLDS, engagement)]
 
-                html += f"""
+                write(f"""
                             <tr>
                                 <td class="date">{video.get('upload_date', 'N/A')}</td>
                                 <td><a href="{video.get('url', '#')}" class="link" target="_blank">View on TikTok</a></td>
@@ -555,21 +581,21 @@ def generate_html_report(accounts_data, output_file):
                                 <td class="metric">{video.get('shares', 0)}</td>
                                 <td class="metric {engagement_class}">{engagement:.1f}%</td>
                             </tr>
-"""
+""")
 
-            html += """
+            write("""
                         </tbody>
                     </table>
                 </div>
-"""
+""")
 
-        html += """
+        write("""
             </div>
         </div>
-"""
+""")
 
     # Add footer and JavaScript
-    html += """
+    write("""
         <div class="footer">
             Warner Music Group · Sound Tracking System<br>
             Data collected from TikTok public profiles
@@ -600,11 +626,14 @@ def generate_html_report(accounts_data, output_file):
     </script>
 </body>
 </html>
-"""
+""")
+
 
-    # Write to file
+def generate_html_report(accounts_data, output_file):
+    """Generate SHADCN-style HTML report."""
+    # Stream straight to disk rather than holding the whole document in memory
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+        write_html_report(f, accounts_data)
 
     print(f"\n✅ Report generated: {output_file}")
 
@@ -615,6 +644,8 @@ def main():
                        help='Only include videos after this date (YYYY-MM-DD)')
     parser.add_argument('--limit', type=int, default=None,
                        help='Maximum videos per account (default: 1000 to get all videos)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'Ignore cached scrapes (default: reuse if under {SCRAPE_CACHE_TTL}s old)')
     args = parser.parse_args()
 
     # Parse since date
@@ -628,11 +659,19 @@ def main():
     print(f"Limit: {args.limit if args.limit else '1000 (default)'} videos per account")
     print()
 
-    # Scrape all accounts
-    accounts_data = {}
-    for account in ACCOUNTS:
-        videos = scrape_account(account, since_date, args.limit)
-        accounts_data[account] = videos
+    # Scrape all accounts in parallel (yt-dlp/network bound, so threads overlap)
+    results = {}
+    if ACCOUNTS:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(ACCOUNTS))) as executor:
+            futures = {
+                executor.submit(scrape_account, account, since_date, args.limit, not args.no_cache): account
+                for account in ACCOUNTS
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+    # Keep the report in ACCOUNTS order regardless of completion order
+    accounts_data = {account: results[account] for account in ACCOUNTS}
 
     print()
     print("="*80)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Shared yt-dlp subprocess streaming for the song CSV and Excel reports
+"""
+
+import subprocess
+import threading
+
+def iter_yt_dlp_lines(cmd, timeout, cwd=None):
+    """
+    Run yt-dlp and yield its stdout lines (bytes) as they are printed.
+
+    stderr is drained on a side thread so a chatty yt-dlp can't fill that pipe
+    and block. Once stdout is exhausted, raises subprocess.TimeoutExpired if the
+    run was killed after timeout seconds, or subprocess.CalledProcessError
+    (with stderr attached) on a nonzero exit. The child is always killed and
+    reaped, including when the caller stops iterating early.
+    """
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd) as proc:
+        stderr_chunks = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()))
+        stderr_reader.start()
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.start()
+        try:
+            yield from proc.stdout
+            proc.wait()
+        finally:
+            timer.cancel()
+            # Bailed out early - make sure the child is gone before reaping it
+            if proc.returncode is None:
+                proc.kill()
+                proc.wait()
+            stderr_reader.join()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if proc.returncode != 0:
+        stderr = stderr_chunks[0] if stderr_chunks else b''
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
@@ -5,12 +5,15 @@ Uses yt-dlp to fetch just the first video timestamp from each account.
 Much faster than a full scrape - only checks the most recent post.
 """
 
-import subprocess
+import asyncio
 import json
 import csv
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
-def check_account_activity(account_username):
+# Max yt-dlp subprocesses in flight at once (all driven from one event loop)
+MAX_WORKERS = 8
+
+async def check_account_activity(account_username):
     """
     Check if account has posted in the last 7 days using yt-dlp.
     Returns: (account, is_active, last_post_date, error)
@@ -28,34 +31,66 @@ def check_account_activity(account_username):
             url
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-        if result.returncode != 0 or not result.stdout.strip():
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            # Keep stdout as bytes - json.loads decodes UTF-8 itself, no text-mode pass
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return (account_username, False, None, "Timeout - account check took too long")
+
+        if proc.returncode != 0 or not stdout.strip():
             return (account_username, False, None, "No videos found or account unavailable")
 
         # Parse the JSON output
-        video_data = json.loads(result.stdout.strip())
+        video_data = json.loads(stdout.strip())
 
         # Get upload date (format: YYYYMMDD)
         upload_date_str = video_data.get('upload_date')
         if not upload_date_str:
             return (account_username, False, None, "Could not extract upload date")
 
-        # Parse the date
-        upload_date = datetime.strptime(upload_date_str, '%Y%m%d')
-        days_ago = (datetime.now() - upload_date).days
+        # Parse the YYYYMMDD date by slicing (no strptime format parsing)
+        upload_date = date(int(upload_date_str[:4]), int(upload_date_str[4:6]), int(upload_date_str[6:8]))
+        days_ago = (date.today() - upload_date).days
 
         is_active = days_ago <= 7
 
-        return (account_username, is_active, upload_date.strftime('%Y-%m-%d'), None)
+        return (account_username, is_active, upload_date.isoformat(), None)
 
-    except subprocess.TimeoutExpired:
-        return (account_username, False, None, "Timeout - account check took too long")
     except json.JSONDecodeError:
         return (account_username, False, None, "Could not parse video data")
     except Exception as e:
         return (account_username, False, None, str(e))
 
+async def check_all_accounts(accounts):
+    """
+    Check all accounts concurrently, printing each result as it arrives.
+    Returns results in the same order as accounts.
+    """
+    semaphore = asyncio.Semaphore(MAX_WORKERS)
+
+    async def bounded_check(account):
+        async with semaphore:
+            return await check_account_activity(account)
+
+    results_by_account = {}
+    pending = [bounded_check(account) for account in accounts]
+    for i, next_result in enumerate(asyncio.as_completed(pending), 1):
+        result = await next_result
+        results_by_account[result[0]] = result
+
+        # Print result
+        status = "✓ ACTIVE" if result[1] else "✗ INACTIVE"
+        date_info = f"(last post: {result[2]})" if result[2] else f"({result[3]})"
+        print(f"[{i}/{len(accounts)}] @{result[0]}: {status} {date_info}")
+
+    # Keep output files in the original account order
+    return [results_by_account[account] for account in accounts]
+
 def main():
     # Read in-house accounts
     inhouse_accounts = [
@@ -74,16 +109,7 @@ def main():
     print(f"Looking for posts within the last 7 days")
     print(f"{'='*80}\n")
 
-    results = []
-    for i, account in enumerate(inhouse_accounts, 1):
-        print(f"[{i}/{len(inhouse_accounts)}] Checking @{account}...", end=' ', flush=True)
-        result = check_account_activity(account)
-        results.append(result)
-
-        # Print result
-        status = "✓ ACTIVE" if result[1] else "✗ INACTIVE"
-        date_info = f"(last post: {result[2]})" if result[2] else f"({result[3]})"
-        print(f"{status} {date_info}")
+    results = asyncio.run(check_all_accounts(inhouse_accounts))
 
     # Separate active and inactive
     active_accounts = [r for r in results if r[1]]
@@ -100,13 +126,12 @@ def main():
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         writer.writerow(['Account', 'Active', 'Last Post Date', 'Error/Note'])
-        for result in results:
-            writer.writerow([
-                result[0],
-                'Yes' if result[1] else 'No',
-                result[2] if result[2] else 'N/A',
-                result[3] if result[3] else ''
-            ])
+        writer.writerows([
+            result[0],
+            'Yes' if result[1] else 'No',
+            result[2] if result[2] else 'N/A',
+            result[3] if result[3] else ''
+        ] for result in results)
 
     print(f"\nFull results saved to: {output_file}")
 
@@ -115,8 +140,7 @@ def main():
     with open(active_output, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         writer.writerow(['Account'])
-        for result in active_accounts:
-            writer.writerow([result[0]])
+        writer.writerows([result[0]] for result in active_accounts)
 
     print(f"Active accounts list saved to: {active_output}")
     print(f"\n{len(active_accounts)} active accounts ready for scraping!\n")
@@ -5,23 +5,30 @@ Scrapes ALL videos from accounts and extracts ALL songs used (no filtering)
 Generates aggregated song usage report
 """
 
+import asyncio
 import csv
-import subprocess
 import json
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from extract_sound_id import extract_sound_id_from_video
-from collections import defaultdict
+from extract_sound_id import cached_extract_sound_id_from_video, extract_sound_id_from_video
+from tiktok_scrape_common import scrape_all_accounts
+
+# Parallel video-page fetches for sound ID extraction (pure network I/O)
+SOUND_ID_WORKERS = 16
 
 def load_accounts(csv_path):
     """Load TikTok accounts to scrape"""
     accounts = []
 
     with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        # Positions of the handle columns in fallback order (no per-row dicts)
+        header = {name: i for i, name in enumerate(next(reader, []))}
+        columns = [header[name] for name in ('URL', 'account Handle', 'Account') if name in header]
         for row in reader:
-            url = row.get('URL', '') or row.get('account Handle', '') or row.get('Account', '')
+            url = next((row[i] for i in columns if i < len(row) and row[i]), '')
             if url and '@' in url:
                 username = url.split('@')[-1].split('?')[0].split('/')[0]
                 if username:
@@ -34,235 +41,155 @@ def load_accounts(csv_path):
 
     return accounts
 
-def scrape_account_videos(username, limit=500, start_date=None):
-    """Scrape videos from a TikTok account using tiktok_analyzer.py"""
-    print(f"  Running yt-dlp scraper for @{username} (limit: {limit} videos)...")
-
-    cmd = [
-        'python3', 'tiktok_analyzer.py',
-        '--url', username,
-        '--limit', str(limit)
-    ]
+class SongAggregate:
+    """Per-sound usage totals; slotted so the catalog stays small and fast to update"""
+    __slots__ = (
+        'song_title', 'artist', 'sound_id', 'total_uses', 'accounts', 'videos',
+        'total_views', 'total_likes', 'total_comments', 'total_shares',
+        'top_video_url', 'top_video_views',
+    )
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-
-        if result.returncode != 0:
-            print(f"    ⚠️  Scrape failed: {result.stderr[:100]}")
-            return []
-
-        # Parse video data from output
-        videos = []
-        output = result.stdout
-
-        # Find all video URLs
-        video_urls = re.findall(r'URL: (https://www\.tiktok\.com/@[^/]+/video/\d+)', output)
-
-        # Parse engagement metrics for each video
-        video_sections = re.split(r'VIDEO #\d+', output)
-
-        for i, section in enumerate(video_sections[1:], 0):  # Skip first empty section
-            if i >= len(video_urls):
-                break
-
-            video_url = video_urls[i]
-
-            # Extract upload date
-            date_match = re.search(r'Upload Date: (\d{4}-\d{2}-\d{2})', section)
-            upload_date = date_match.group(1) if date_match else 'Unknown'
-
-            # Filter by date if provided
-            if start_date and upload_date != 'Unknown':
-                try:
-                    upload_dt = datetime.strptime(upload_date, '%Y-%m-%d')
-                    if upload_dt < start_date:
-                        continue  # Skip videos before start date
-                except:
-                    pass
-
-            # Extract engagement metrics
-            views_match = re.search(r'Views:\s+[\d.KM]+\s+\(([0-9,]+)\)', section)
-            likes_match = re.search(r'Likes:\s+[\d.KM]+\s+\(([0-9,]+)\)', section)
-            comments_match = re.search(r'Comments:\s+[\d.KM]+\s+\(([0-9,]+)\)', section)
-            shares_match = re.search(r'Shares:\s+[\d.KM]+\s+\(([0-9,]+)\)', section)
-
-            views = int(views_match.group(1).replace(',', '')) if views_match else 0
-            likes = int(likes_match.group(1).replace(',', '')) if likes_match else 0
-            comments = int(comments_match.group(1).replace(',', '')) if comments_match else 0
-            shares = int(shares_match.group(1).replace(',', '')) if shares_match else 0
-
-            # Extract caption/title
-            title_match = re.search(r'Title/Caption: (.+)', section)
-            title = title_match.group(1).strip() if title_match else ''
-
-            video_data = {
-                'account': username,
-                'url': video_url,
-                'upload_date': upload_date,
-                'title': title,
-                'views': views,
-                'likes': likes,
-                'comments': comments,
-                'shares': shares
-            }
-
-            videos.append(video_data)
-
-        return videos
-
-    except subprocess.TimeoutExpired:
-        print(f"    ⚠️  Timeout after 10 minutes")
-        return []
-    except Exception as e:
-        print(f"    ⚠️  Error: {str(e)[:100]}")
-        return []
-
-def extract_all_songs(videos):
+    def __init__(self, sound_id, song_title):
+        self.song_title = song_title
+        self.artist = ''
+        self.sound_id = sound_id
+        self.total_uses = 0
+        self.accounts = set()
+        self.videos = []
+        self.total_views = 0
+        self.total_likes = 0
+        self.total_comments = 0
+        self.total_shares = 0
+        self.top_video_url = ''
+        self.top_video_views = 0
+
+def extract_all_songs(videos, use_cache=True):
     """Extract sound IDs and song info from all videos"""
-    songs_catalog = defaultdict(lambda: {
-        'song_title': '',
-        'artist': '',
-        'sound_id': '',
-        'total_uses': 0,
-        'accounts': set(),
-        'videos': [],
-        'total_views': 0,
-        'total_likes': 0,
-        'total_comments': 0,
-        'total_shares': 0
-    })
+    fetch = cached_extract_sound_id_from_video if use_cache else extract_sound_id_from_video
+    songs_catalog = {}
 
     print(f"\n🔍 Extracting sound IDs from all videos...")
     print(f"  Processing {len(videos)} videos...")
     print()
 
-    for i, video in enumerate(videos, 1):
-        print(f"  [{i}/{len(videos)}] @{video['account']} - {video['url'][:60]}...")
-
-        # Extract sound ID from video page
-        sound_id, song_title = extract_sound_id_from_video(video['url'])
-
-        if sound_id:
-            # Add to catalog
-            song_key = sound_id
-            song_data = songs_catalog[song_key]
-
-            # Update song info (use first occurrence data)
-            if not song_data['song_title']:
-                song_data['song_title'] = song_title or 'Unknown'
-                song_data['sound_id'] = sound_id
-
-            # Aggregate stats
-            song_data['total_uses'] += 1
-            song_data['accounts'].add(video['account'])
-            song_data['videos'].append({
-                'account': video['account'],
-                'url': video['url'],
-                'upload_date': video['upload_date'],
-                'views': video['views'],
-                'likes': video['likes'],
-                'comments': video['comments'],
-                'shares': video['shares'],
-                'title': video['title']
-            })
-            song_data['total_views'] += video['views']
-            song_data['total_likes'] += video['likes']
-            song_data['total_comments'] += video['comments']
-            song_data['total_shares'] += video['shares']
-
-            print(f"    ✅ Sound ID: {sound_id} | Song: {song_title}")
-        else:
-            print(f"    ❌ Could not extract sound ID")
+    def lookup(video):
+        """Reuse the analyzer's sound ID; only fetch the video page when it has none"""
+        if video.get('sound_id'):
+            return video['sound_id'], video.get('song_title')
+        return fetch(video['url'])
+
+    # Fetch video pages in parallel; results arrive in order and are
+    # aggregated here on the main thread (no locking needed)
+    with ThreadPoolExecutor(max_workers=SOUND_ID_WORKERS) as executor:
+        lookups = executor.map(lookup, videos)
+
+        for i, (video, (sound_id, song_title)) in enumerate(zip(videos, lookups), 1):
+            print(f"  [{i}/{len(videos)}] @{video['account']} - {video['url'][:60]}...")
+
+            if sound_id:
+                # Add to catalog (song info comes from the first occurrence)
+                song_data = songs_catalog.get(sound_id)
+                if song_data is None:
+                    song_data = songs_catalog[sound_id] = SongAggregate(sound_id, song_title or 'Unknown')
+
+                # Aggregate stats (the scraped video dict is stored as-is)
+                views = video['views']
+                likes = video['likes']
+                comments = video['comments']
+                shares = video['shares']
+                song_data.total_uses += 1
+                song_data.total_views += views
+                song_data.total_likes += likes
+                song_data.total_comments += comments
+                song_data.total_shares += shares
+                song_data.accounts.add(video['account'])
+                song_data.videos.append(video)
+
+                # Running top video (first video wins ties)
+                if not song_data.top_video_url or views > song_data.top_video_views:
+                    song_data.top_video_url = video['url']
+                    song_data.top_video_views = views
+
+                print(f"    ✅ Sound ID: {sound_id} | Song: {song_title}")
+            else:
+                print(f"    ❌ Could not extract sound ID")
 
     return songs_catalog
 
-def generate_aggregated_csv_report(songs_catalog, output_path):
-    """Generate aggregated CSV report showing all songs used"""
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = [
-            'Song Title',
-            'Sound ID',
-            'Total Uses',
-            'Accounts Using',
-            'Account List',
-            'Total Views',
-            'Avg Views per Video',
-            'Total Likes',
-            'Total Comments',
-            'Total Shares',
-            'Avg Engagement Rate (%)',
-            'Top Video URL',
-            'Top Video Views'
-        ]
-
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        # Sort by total uses
-        sorted_songs = sorted(songs_catalog.items(),
-                            key=lambda x: x[1]['total_uses'],
-                            reverse=True)
-
-        for sound_id, song_data in sorted_songs:
+def generate_aggregated_csv_report(sorted_songs, output_path):
+    """Generate aggregated CSV report showing all songs used (sorted_songs: by total uses)"""
+    fieldnames = [
+        'Song Title',
+        'Sound ID',
+        'Total Uses',
+        'Accounts Using',
+        'Account List',
+        'Total Views',
+        'Avg Views per Video',
+        'Total Likes',
+        'Total Comments',
+        'Total Shares',
+        'Avg Engagement Rate (%)',
+        'Top Video URL',
+        'Top Video Views'
+    ]
+
+    def rows():
+        for song_data in sorted_songs:
             # Calculate averages
-            avg_views = song_data['total_views'] // song_data['total_uses'] if song_data['total_uses'] > 0 else 0
+            avg_views = song_data.total_views // song_data.total_uses if song_data.total_uses > 0 else 0
 
             # Calculate average engagement rate
             avg_engagement_rate = 0
-            if song_data['total_views'] > 0:
-                total_engagement = song_data['total_likes'] + song_data['total_comments'] + song_data['total_shares']
-                avg_engagement_rate = (total_engagement / song_data['total_views']) * 100
-
-            # Find top video
-            top_video = max(song_data['videos'], key=lambda x: x['views']) if song_data['videos'] else {}
+            if song_data.total_views > 0:
+                total_engagement = song_data.total_likes + song_data.total_comments + song_data.total_shares
+                avg_engagement_rate = (total_engagement / song_data.total_views) * 100
 
             # Format accounts list
-            accounts_list = ', '.join([f"@{a}" for a in sorted(song_data['accounts'])])
-
-            writer.writerow({
-                'Song Title': song_data['song_title'],
-                'Sound ID': song_data['sound_id'],
-                'Total Uses': song_data['total_uses'],
-                'Accounts Using': len(song_data['accounts']),
-                'Account List': accounts_list,
-                'Total Views': song_data['total_views'],
-                'Avg Views per Video': avg_views,
-                'Total Likes': song_data['total_likes'],
-                'Total Comments': song_data['total_comments'],
-                'Total Shares': song_data['total_shares'],
-                'Avg Engagement Rate (%)': f"{avg_engagement_rate:.2f}",
-                'Top Video URL': top_video.get('url', ''),
-                'Top Video Views': top_video.get('views', 0)
-            })
-
-def generate_detailed_csv_report(songs_catalog, output_path):
-    """Generate detailed CSV report listing all individual videos"""
+            accounts_list = ', '.join([f"@{a}" for a in sorted(song_data.accounts)])
+
+            yield (
+                song_data.song_title,
+                song_data.sound_id,
+                song_data.total_uses,
+                len(song_data.accounts),
+                accounts_list,
+                song_data.total_views,
+                avg_views,
+                song_data.total_likes,
+                song_data.total_comments,
+                song_data.total_shares,
+                f"{avg_engagement_rate:.2f}",
+                song_data.top_video_url,
+                song_data.top_video_views
+            )
+
+    # Positional rows streamed through writerows (no per-row dicts)
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = [
-            'Song Title',
-            'Sound ID',
-            'Account',
-            'Upload Date',
-            'Views',
-            'Likes',
-            'Comments',
-            'Shares',
-            'Engagement Rate (%)',
-            'Video URL',
-            'Caption'
-        ]
-
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        # Sort by total uses, then by views within each song
-        sorted_songs = sorted(songs_catalog.items(),
-                            key=lambda x: x[1]['total_uses'],
-                            reverse=True)
-
-        for sound_id, song_data in sorted_songs:
-            # Sort videos by views
-            sorted_videos = sorted(song_data['videos'], key=lambda x: x['views'], reverse=True)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows())
+
+def generate_detailed_csv_report(sorted_songs, output_path):
+    """Generate detailed CSV report listing all individual videos (sorted_songs: by total uses)"""
+    fieldnames = [
+        'Song Title',
+        'Sound ID',
+        'Account',
+        'Upload Date',
+        'Views',
+        'Likes',
+        'Comments',
+        'Shares',
+        'Engagement Rate (%)',
+        'Video URL',
+        'Caption'
+    ]
+
+    def rows():
+        # Songs arrive sorted by total uses; sort videos by views within each song
+        for song_data in sorted_songs:
+            sorted_videos = sorted(song_data.videos, key=itemgetter('views'), reverse=True)
 
             for video in sorted_videos:
                 # Calculate engagement rate
@@ -270,19 +197,25 @@ def generate_detailed_csv_report(songs_catalog, output_path):
                 if video['views'] > 0:
                     engagement_rate = ((video['likes'] + video['comments'] + video['shares']) / video['views']) * 100
 
-                writer.writerow({
-                    'Song Title': song_data['song_title'],
-                    'Sound ID': song_data['sound_id'],
-                    'Account': f"@{video['account']}",
-                    'Upload Date': video['upload_date'],
-                    'Views': video['views'],
-                    'Likes': video['likes'],
-                    'Comments': video['comments'],
-                    'Shares': video['shares'],
-                    'Engagement Rate (%)': f"{engagement_rate:.2f}",
-                    'Video URL': video['url'],
-                    'Caption': video['title'][:100]  # Truncate long captions
-                })
+                yield (
+                    song_data.song_title,
+                    song_data.sound_id,
+                    f"@{video['account']}",
+                    video['upload_date'],
+                    video['views'],
+                    video['likes'],
+                    video['comments'],
+                    video['shares'],
+                    f"{engagement_rate:.2f}",
+                    video['url'],
+                    video['title'][:100]  # Truncate long captions
+                )
+
+    # Positional rows streamed through writerows (no per-row dicts)
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows())
 
 def main():
     import argparse
@@ -298,6 +231,8 @@ def main():
                        help='Start date filter (YYYY-MM-DD)')
     parser.add_argument('--output', default='full_catalog_report',
                        help='Output filename prefix (default: full_catalog_report)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-fetch every sound ID instead of using the on-disk cache')
 
     args = parser.parse_args()
 
@@ -331,13 +266,14 @@ def main():
     print("-" * 80)
     print()
 
+    # Accounts are scraped concurrently; results come back in account order
+    results = asyncio.run(scrape_all_accounts(accounts, limit=args.limit, start_date=start_date))
+
     all_videos = []
-    for i, username in enumerate(accounts, 1):
-        print(f"[{i}/{len(accounts)}] Scraping @{username}...")
-        videos = scrape_account_videos(username, limit=args.limit, start_date=start_date)
+    for i, (username, videos) in enumerate(zip(accounts, results), 1):
         all_videos.extend(videos)
-        print(f"  ✅ Found {len(videos)} videos from @{username}")
-        print()
+        print(f"[{i}/{len(accounts)}] ✅ Found {len(videos)} videos from @{username}")
+    print()
 
     print(f"📊 Total videos scraped: {len(all_videos)}")
     print()
@@ -345,11 +281,14 @@ def main():
     # STEP 3: Extract all songs
     print("🎵 STEP 3: Extracting ALL Songs from Videos")
     print("-" * 80)
-    songs_catalog = extract_all_songs(all_videos)
+    songs_catalog = extract_all_songs(all_videos, use_cache=not args.no_cache)
     print()
     print(f"✅ Found {len(songs_catalog)} unique songs!")
     print()
 
+    # Sort once by total uses; shared by both reports and the summary
+    sorted_songs = sorted(songs_catalog.values(), key=attrgetter('total_uses'), reverse=True)
+
     # STEP 4: Generate reports
     print("📄 STEP 4: Generating Reports")
     print("-" * 80)
@@ -357,10 +296,10 @@ def main():
     aggregated_path = f"{args.output}_aggregated.csv"
     detailed_path = f"{args.output}_detailed.csv"
 
-    generate_aggregated_csv_report(songs_catalog, aggregated_path)
+    generate_aggregated_csv_report(sorted_songs, aggregated_path)
     print(f"✅ Aggregated report saved to: {aggregated_path}")
 
-    generate_detailed_csv_report(songs_catalog, detailed_path)
+    generate_detailed_csv_report(sorted_songs, detailed_path)
     print(f"✅ Detailed report saved to: {detailed_path}")
     print()
 
@@ -376,19 +315,17 @@ def main():
 
     # Top 10 songs
     print("Top 10 Most Used Songs:")
-    sorted_songs = sorted(songs_catalog.items(),
-                         key=lambda x: x[1]['total_uses'],
-                         reverse=True)
-
-    for i, (sound_id, song_data) in enumerate(sorted_songs[:10], 1):
-        print(f"  {i}. {song_data['song_title']}: {song_data['total_uses']} uses across {len(song_data['accounts'])} account(s)")
+    for i, song_data in enumerate(sorted_songs[:10], 1):
+        print(f"  {i}. {song_data.song_title}: {song_data.total_uses} uses across {len(song_data.accounts)} account(s)")
     print()
 
-    # Total engagement metrics
-    total_views = sum(song['total_views'] for song in songs_catalog.values())
-    total_likes = sum(song['total_likes'] for song in songs_catalog.values())
-    total_comments = sum(song['total_comments'] for song in songs_catalog.values())
-    total_shares = sum(song['total_shares'] for song in songs_catalog.values())
+    # Total engagement metrics (one pass over the catalog)
+    total_views = total_likes = total_comments = total_shares = 0
+    for song in sorted_songs:
+        total_views += song.total_views
+        total_likes += song.total_likes
+        total_comments += song.total_comments
+        total_shares += song.total_shares
 
     print("Total engagement across all videos:")
     print(f"  Views: {total_views:,}")
@@ -4,18 +4,26 @@ Full Production Scrape - Warner Sound Tracker
 Scrapes all 5 accounts, matches against Warner songs, generates CSV report
 """
 
+import asyncio
 import csv
-import subprocess
 import json
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from extract_sound_id import extract_sound_id_from_music_link, extract_sound_id_from_video
+from extract_sound_id import extract_sound_id_from_music_link, cached_extract_sound_id_from_video
+from tiktok_scrape_common import scrape_all_accounts
+
+# Only videos from this date onwards are included
+START_DATE = datetime(2025, 10, 14)
+
+# Parallel music/video-page fetches for sound ID extraction (pure network I/O)
+SOUND_ID_WORKERS = 16
 
 def load_warner_songs(csv_path):
     """Load Warner songs and extract sound IDs"""
     tracked_songs = {}
 
+    songs = []
     with open(csv_path, 'r', encoding='utf-8-sig') as f:
         reader = csv.DictReader(f)
         for row in reader:
@@ -24,17 +32,24 @@ def load_warner_songs(csv_path):
             artist = row.get('Artist Name', '').strip()
 
             if song_link and song:
-                print(f"  Processing: {song} - {artist}")
-                sound_id, fetched_title, fetched_artist = extract_sound_id_from_music_link(song_link)
-                if sound_id:
-                    tracked_songs[sound_id] = {
-                        'song': song,
-                        'artist': artist,
-                        'link': song_link
-                    }
-                    print(f"    ✅ Sound ID: {sound_id}")
-                else:
-                    print(f"    ⚠️  Could not extract sound ID")
+                songs.append((song, artist, song_link))
+
+    # Fetch music pages in parallel; results arrive in CSV order so later
+    # rows still win on duplicate sound IDs
+    with ThreadPoolExecutor(max_workers=SOUND_ID_WORKERS) as executor:
+        lookups = executor.map(extract_sound_id_from_music_link, (song_link for _, _, song_link in songs))
+
+        for (song, artist, song_link), (sound_id, fetched_title, fetched_artist) in zip(songs, lookups):
+            print(f"  Processing: {song} - {artist}")
+            if sound_id:
+                tracked_songs[sound_id] = {
+                    'song': song,
+                    'artist': artist,
+                    'link': song_link
+                }
+                print(f"    ✅ Sound ID: {sound_id}")
+            else:
+                print(f"    ⚠️  Could not extract sound ID")
 
     return tracked_songs
 
@@ -43,9 +58,12 @@ def load_accounts(csv_path):
     accounts = []
 
     with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        # Positions of the handle columns in fallback order (no per-row dicts)
+        header = {name: i for i, name in enumerate(next(reader, []))}
+        columns = [header[name] for name in ('URL', 'account Handle') if name in header]
         for row in reader:
-            url = row.get('URL', '') or row.get('account Handle', '')
+            url = next((row[i] for i in columns if i < len(row) and row[i]), '')
             if url and '@' in url:
                 username = url.split('@')[-1].split('?')[0].split('/')[0]
                 if username:
@@ -53,90 +71,6 @@ def load_accounts(csv_path):
 
     return accounts
 
-def scrape_account_videos(username, limit=500):
-    """Scrape videos from a TikTok account using tiktok_analyzer.py"""
-    print(f"  Running yt-dlp scraper for @{username} (limit: {limit} videos)...")
-
-    cmd = [
-        'python3', 'tiktok_analyzer.py',
-        '--url', username,
-        '--limit', str(limit)
-    ]
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-
-        if result.returncode != 0:
-            print(f"    ⚠️  Scrape failed: {result.stderr[:100]}")
-            return []
-
-        # Parse video data from output
-        videos = []
-        output = result.stdout
-
-        # Find all video URLs
-        video_urls = re.findall(r'URL: (https://www\.tiktok\.com/@[^/]+/video/\d+)', output)
-
-        # Parse engagement metrics for each video
-        video_sections = re.split(r'VIDEO #\d+', output)
-
-        for i, section in enumerate(video_sections[1:], 0):  # Skip first empty section
-            if i >= len(video_urls):
-                break
-
-            video_url = video_urls[i]
-
-            # Extract upload date
-            date_match = re.search(r'Upload Date: (\d{4}-\d{2}-\d{2})', section)
-            upload_date = date_match.group(1) if date_match else 'Unknown'
-
-            # Filter by date (October 14, 2025 onwards)
-            if upload_date != 'Unknown':
-                try:
-                    upload_dt = datetime.strptime(upload_date, '%Y-%m-%d')
-                    start_date = datetime(2025, 10, 14)
-                    if upload_dt < start_date:
-                        continue  # Only include Oct 14, 2025 onwards
-                except:
-                    pass
-
-            # Extract engagement metrics
-            views_match = re.search(r'Views:\s+[\d.KM]+\s+\(([0-9,]+)\)', section)
-            likes_match = re.search(r'Likes:\s+[\d.KM]+\s+\(([0-9,]+)\)', section)
-            comments_match = re.search(r'Comments:\s+[\d.KM]+\s+\(([0-9,]+)\)', section)
-            shares_match = re.search(r'Shares:\s+[\d.KM]+\s+\(([0-9,]+)\)', section)
-
-            views = int(views_match.group(1).replace(',', '')) if views_match else 0
-            likes = int(likes_match.group(1).replace(',', '')) if likes_match else 0
-            comments = int(comments_match.group(1).replace(',', '')) if comments_match else 0
-            shares = int(shares_match.group(1).replace(',', '')) if shares_match else 0
-
-            # Extract caption/title
-            title_match = re.search(r'Title/Caption: (.+)', section)
-            title = title_match.group(1).strip() if title_match else ''
-
-            video_data = {
-                'account': username,
-                'url': video_url,
-                'upload_date': upload_date,
-                'title': title,
-                'views': views,
-                'likes': likes,
-                'comments': comments,
-                'shares': shares
-            }
-
-            videos.append(video_data)
-
-        return videos
-
-    except subprocess.TimeoutExpired:
-        print(f"    ⚠️  Timeout after 5 minutes")
-        return []
-    except Exception as e:
-        print(f"    ⚠️  Error: {str(e)[:100]}")
-        return []
-
 def match_videos_to_songs(videos, tracked_songs):
     """Extract sound IDs and match videos to Warner songs"""
     matched_videos = []
@@ -145,69 +79,80 @@ def match_videos_to_songs(videos, tracked_songs):
     print(f"  Processing {len(videos)} videos...")
     print()
 
-    for i, video in enumerate(videos, 1):
-        print(f"  [{i}/{len(videos)}] @{video['account']} - {video['url'][:60]}...")
-
-        # Extract sound ID from video page
-        sound_id, song_title = extract_sound_id_from_video(video['url'])
-
-        if sound_id and sound_id in tracked_songs:
-            # Match found!
-            matched_video = {
-                **video,
-                'sound_id': sound_id,
-                'warner_song': tracked_songs[sound_id]['song'],
-                'warner_artist': tracked_songs[sound_id]['artist'],
-                'detected_song_title': song_title
-            }
-            matched_videos.append(matched_video)
-            print(f"    ✅ MATCH! {tracked_songs[sound_id]['song']} - {tracked_songs[sound_id]['artist']}")
-        else:
-            print(f"    ❌ No match (Sound ID: {sound_id})")
+    def lookup(video):
+        """Reuse the analyzer's sound ID; only fetch the video page when it has none"""
+        if video.get('sound_id'):
+            return video['sound_id'], video.get('song_title')
+        return cached_extract_sound_id_from_video(video['url'])
+
+    # Fetch video pages in parallel; results arrive in order and are
+    # matched here on the main thread (no locking needed)
+    with ThreadPoolExecutor(max_workers=SOUND_ID_WORKERS) as executor:
+        lookups = executor.map(lookup, videos)
+
+        for i, (video, (sound_id, song_title)) in enumerate(zip(videos, lookups), 1):
+            print(f"  [{i}/{len(videos)}] @{video['account']} - {video['url'][:60]}...")
+
+            if sound_id and sound_id in tracked_songs:
+                # Match found!
+                matched_video = {
+                    **video,
+                    'sound_id': sound_id,
+                    'warner_song': tracked_songs[sound_id]['song'],
+                    'warner_artist': tracked_songs[sound_id]['artist'],
+                    'detected_song_title': song_title
+                }
+                matched_videos.append(matched_video)
+                print(f"    ✅ MATCH! {tracked_songs[sound_id]['song']} - {tracked_songs[sound_id]['artist']}")
+            else:
+                print(f"    ❌ No match (Sound ID: {sound_id})")
 
     return matched_videos
 
 def generate_csv_report(matched_videos, output_path):
     """Generate CSV report with matched videos"""
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = [
-            'Account',
-            'Song Name',
-            'Artist',
-            'Upload Date',
-            'Views',
-            'Likes',
-            'Comments',
-            'Shares',
-            'Engagement Rate (%)',
-            'Video URL',
-            'Sound ID',
-            'Video Caption'
-        ]
-
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    fieldnames = [
+        'Account',
+        'Song Name',
+        'Artist',
+        'Upload Date',
+        'Views',
+        'Likes',
+        'Comments',
+        'Shares',
+        'Engagement Rate (%)',
+        'Video URL',
+        'Sound ID',
+        'Video Caption'
+    ]
 
+    def rows():
         for video in matched_videos:
             # Calculate engagement rate
             engagement_rate = 0
             if video['views'] > 0:
                 engagement_rate = ((video['likes'] + video['comments'] + video['shares']) / video['views']) * 100
 
-            writer.writerow({
-                'Account': f"@{video['account']}",
-                'Song Name': video['warner_song'],
-                'Artist': video['warner_artist'],
-                'Upload Date': video['upload_date'],
-                'Views': video['views'],
-                'Likes': video['likes'],
-                'Comments': video['comments'],
-                'Shares': video['shares'],
-                'Engagement Rate (%)': f"{engagement_rate:.2f}",
-                'Video URL': video['url'],
-                'Sound ID': video['sound_id'],
-                'Video Caption': video['title'][:100]  # Truncate long captions
-            })
+            yield (
+                f"@{video['account']}",
+                video['warner_song'],
+                video['warner_artist'],
+                video['upload_date'],
+                video['views'],
+                video['likes'],
+                video['comments'],
+                video['shares'],
+                f"{engagement_rate:.2f}",
+                video['url'],
+                video['sound_id'],
+                video['title'][:100]  # Truncate long captions
+            )
+
+    # Positional rows streamed through writerows (no per-row dicts)
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows())
 
 def main():
     print("=" * 80)
@@ -239,13 +184,14 @@ def main():
     print("-" * 80)
     print()
 
+    # Accounts are scraped concurrently; results come back in account order
+    results = asyncio.run(scrape_all_accounts(accounts, limit=500, start_date=START_DATE))
+
     all_videos = []
-    for i, username in enumerate(accounts, 1):
-        print(f"[{i}/{len(accounts)}] Scraping @{username}...")
-        videos = scrape_account_videos(username, limit=500)
+    for i, (username, videos) in enumerate(zip(accounts, results), 1):
         all_videos.extend(videos)
-        print(f"  ✅ Found {len(videos)} videos from @{username} (after date filter)")
-        print()
+        print(f"[{i}/{len(accounts)}] ✅ Found {len(videos)} videos from @{username} (after date filter)")
+    print()
 
     print(f"📊 Total videos scraped: {len(all_videos)}")
     print()
@@ -4,11 +4,15 @@ In-House Network Scraper and HTML Generator
 Scrapes TikTok accounts and generates HTML tracker
 """
 
-import subprocess
+import argparse
+import asyncio
 import json
 import re
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
 import sys
 
 # Import configuration
@@ -18,14 +22,111 @@ except ImportError:
     print("ERROR: config.py not found. Please create config.py with your account configuration.")
     sys.exit(1)
 
+# Use orjson for the per-line yt-dlp decode when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Use accounts and exclusive songs from config
 ACCOUNTS = config.ACCOUNTS
-EXCLUSIVE_SONGS = config.EXCLUSIVE_SONGS
-
-def scrape_account(account):
+EXCLUSIVE_SONGS = frozenset(config.EXCLUSIVE_SONGS)  # O(1) membership whatever config uses
+
+# Max yt-dlp processes running at once (keeps TikTok rate limits happy)
+MAX_CONCURRENT_SCRAPES = getattr(config, 'MAX_CONCURRENCY', 8)
+
+# Seconds before a stuck yt-dlp is killed so it can't hold up the rest of the batch
+SCRAPE_TIMEOUT = getattr(config, 'SCRAPE_TIMEOUT', 300)
+
+# Per-line read limit for yt-dlp output (JSON records can exceed asyncio's 64 KiB default)
+YT_DLP_LINE_LIMIT = 2 ** 20
+
+# Videos shown per account card in the accounts tab
+ACCOUNT_TOP_VIDEOS = 10
+
+# Raw yt-dlp output per account per day, reused on reruns (skip with --no-cache)
+SCRAPE_CACHE_DIR = Path(getattr(config, 'SCRAPE_CACHE_DIR', 'cache'))
+
+def parse_video_line(line, account, cutoff_date):
+    """Parse one yt-dlp JSON line into a video record (None if skipped or unparseable)"""
+    # Blank-line check without copying the line (isspace stops at the first '{')
+    if not line or line.isspace():
+        return None
+
+    try:
+        video_data = _json_loads(line)
+    except json.JSONDecodeError as e:
+        print(f"  ⚠️  Error parsing JSON for {account}: {e}")
+        return None
+
+    # Extract upload date
+    upload_date = video_data.get('upload_date', '')
+    if upload_date:
+        try:
+            # Fixed YYYYMMDD, so slice it rather than strptime
+            if len(upload_date) != 8 or not upload_date.isdigit():
+                raise ValueError(upload_date)
+            year, month, day = upload_date[:4], upload_date[4:6], upload_date[6:]
+            upload_datetime = datetime(int(year), int(month), int(day))
+
+            # Filter for configured cutoff date
+            if upload_datetime < cutoff_date:
+                return None
+
+            formatted_date = f"{year}-{month}-{day}"
+        except:
+            formatted_date = upload_date
+    else:
+        return None  # Skip if no date
+
+    # Metrics bound once (yt-dlp reports null for hidden counts)
+    views = video_data.get('view_count', 0) or 0
+    likes = video_data.get('like_count', 0) or 0
+    comments = video_data.get('comment_count', 0) or 0
+    shares = video_data.get('repost_count', 0) or 0
+
+    # Calculate engagement rate
+    engagement_rate = ((likes + comments + shares) / views) * 100 if views > 0 else 0
+
+    song_title = video_data.get('track', '')
+    song_artist = video_data.get('artist', '')
+
+    return {
+        'id': video_data.get('id'),
+        'url': video_data.get('webpage_url') or video_data.get('url'),
+        'title': video_data.get('title', '').strip(),
+        'description': video_data.get('description', '').strip(),
+        'views': views,
+        'likes': likes,
+        'comments': comments,
+        'shares': shares,
+        'duration': video_data.get('duration', 0),
+        'upload_date': formatted_date,
+        'timestamp': video_data.get('timestamp', 0),
+        'song_title': song_title,
+        'song_artist': song_artist,
+        # Built once here; both aggregators and the exclusive-song filter key on it
+        'sound_key': f"{song_title or 'Unknown'} - {song_artist or 'Unknown'}",
+        'account': account,
+        'engagement_rate': engagement_rate
+    }
+
+async def scrape_account(account, use_cache=True):
     """Scrape a single TikTok account using yt-dlp - ALL videos"""
     print(f"Scraping {account}...")
 
+    cutoff_date = config.CUTOFF_DATE
+    cutoff_date_str = cutoff_date.strftime('%Y-%m-%d')
+
+    # Reuse today's raw yt-dlp output for this account if it is on disk
+    cache_path = SCRAPE_CACHE_DIR / f"{account}-{datetime.now():%Y%m%d}.ndjson"
+    if use_cache and cache_path.exists():
+        with open(cache_path, 'rb') as f:
+            videos = [video for video in (parse_video_line(line, account, cutoff_date) for line in f) if video]
+        print(f"  ✓ Found {len(videos)} videos from {cutoff_date_str} onwards (cached)")
+        return videos
+
     profile_url = f"https://www.tiktok.com/{account}"
 
     cmd = [
@@ -35,168 +136,154 @@ def scrape_account(account):
         profile_url
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        limit=YT_DLP_LINE_LIMIT
+    )
+    # Drain stderr alongside stdout so a chatty yt-dlp can't block on a full pipe
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
 
-    if result.returncode != 0:
-        print(f"  ⚠️  Error scraping {account}: {result.stderr}")
+    # Parse each JSON line as yt-dlp prints it instead of buffering all of stdout,
+    # teeing the raw lines to a partial cache file that only replaces the real one on success
+    SCRAPE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    partial_path = cache_path.with_suffix('.partial')
+    videos = []
+
+    async def read_videos():
+        with open(partial_path, 'wb') as cache_file:
+            async for line in proc.stdout:
+                cache_file.write(line)
+                video_info = parse_video_line(line, account, cutoff_date)
+                if video_info is not None:
+                    videos.append(video_info)
+        await proc.wait()
+
+    try:
+        await asyncio.wait_for(read_videos(), timeout=SCRAPE_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        stderr_task.cancel()
+        partial_path.unlink()
+        print(f"  ⚠️  Timeout scraping {account} after {SCRAPE_TIMEOUT}s")
         return []
 
-    videos = []
-    for line in result.stdout.strip().split('\n'):
-        if line:
-            try:
-                video_data = json.loads(line)
-
-                # Extract upload date
-                upload_date = video_data.get('upload_date', '')
-                if upload_date:
-                    try:
-                        upload_datetime = datetime.strptime(upload_date, '%Y%m%d')
-
-                        # Filter for configured cutoff date
-                        if upload_datetime < config.CUTOFF_DATE:
-                            continue
-
-                        formatted_date = upload_datetime.strftime('%Y-%m-%d')
-                    except:
-                        formatted_date = upload_date
-                else:
-                    formatted_date = 'Unknown'
-                    continue  # Skip if no date
-
-                video_info = {
-                    'id': video_data.get('id'),
-                    'url': video_data.get('webpage_url') or video_data.get('url'),
-                    'title': video_data.get('title', '').strip(),
-                    'description': video_data.get('description', '').strip(),
-                    'views': video_data.get('view_count', 0),
-                    'likes': video_data.get('like_count', 0),
-                    'comments': video_data.get('comment_count', 0),
-                    'shares': video_data.get('repost_count', 0),
-                    'duration': video_data.get('duration', 0),
-                    'upload_date': formatted_date,
-                    'timestamp': video_data.get('timestamp', 0),
-                    'song_title': video_data.get('track', ''),
-                    'song_artist': video_data.get('artist', ''),
-                    'account': account
-                }
-
-                # Calculate engagement rate
-                if video_info['views'] > 0:
-                    engagement = ((video_info['likes'] + video_info['comments'] + video_info['shares']) / video_info['views']) * 100
-                    video_info['engagement_rate'] = engagement
-                else:
-                    video_info['engagement_rate'] = 0
-
-                videos.append(video_info)
-
-            except json.JSONDecodeError as e:
-                print(f"  ⚠️  Error parsing JSON for {account}: {e}")
-                continue
-
-    cutoff_date_str = config.CUTOFF_DATE.strftime('%Y-%m-%d')
+    stderr = await stderr_task
+
+    if proc.returncode != 0:
+        partial_path.unlink()
+        print(f"  ⚠️  Error scraping {account}: {stderr.decode('utf-8', 'replace')}")
+        return []
+
+    partial_path.replace(cache_path)
+
     print(f"  ✓ Found {len(videos)} videos from {cutoff_date_str} onwards")
     return videos
 
-def aggregate_by_sound(all_videos):
-    """Aggregate videos by sound/song - filtering out exclusive songs"""
-    sound_stats = defaultdict(lambda: {
-        'total_uses': 0,
-        'total_views': 0,
-        'total_likes': 0,
-        'total_comments': 0,
-        'total_shares': 0,
-        'total_engagement': 0,
-        'videos': [],
-        'accounts': set(),
-        'song': '',
-        'artist': ''
-    })
+async def scrape_all_accounts(accounts, use_cache=True):
+    """Scrape all accounts concurrently (capped at MAX_CONCURRENT_SCRAPES), in account order"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+    async def bounded_scrape(account):
+        async with semaphore:
+            return await scrape_account(account, use_cache=use_cache)
+
+    return await asyncio.gather(*(bounded_scrape(account) for account in accounts))
+
+def aggregate_videos(all_videos):
+    """Aggregate videos by sound (exclusive songs filtered out) and by account in one pass (all_videos: by views)"""
+    # Running totals as flat lists (index writes are cheaper than keyed ones):
+    # per sound: [uses, views, likes, comments, shares, engagement, videos, accounts, song, artist]
+    # per account: [video count, views, likes, comments, shares, engagement, top videos, unique sounds]
+    sound_totals = defaultdict(lambda: [0, 0, 0, 0, 0, 0, [], set(), '', ''])
+    account_totals = defaultdict(lambda: [0, 0, 0, 0, 0, 0, [], set()])
 
     filtered_count = 0
     for video in all_videos:
-        song = video['song_title'] or 'Unknown'
-        artist = video['song_artist'] or 'Unknown'
-        sound_key = f"{song} - {artist}"
-
-        # Skip exclusive songs
+        sound_key = video['sound_key']
+        account = video['account']
+        views = video['views']
+        likes = video['likes']
+        comments = video['comments']
+        shares = video['shares']
+        engagement_rate = video['engagement_rate']
+
+        totals = account_totals[account]
+        totals[0] += 1
+        totals[1] += views
+        totals[2] += likes
+        totals[3] += comments
+        totals[4] += shares
+        totals[5] += engagement_rate
+        # Input is ranked by views, so the first few per account are its top videos
+        if totals[0] <= ACCOUNT_TOP_VIDEOS:
+            totals[6].append(video)
+        totals[7].add(sound_key)
+
+        # Skip exclusive songs (sound stats only - they still count for their account)
         if sound_key in EXCLUSIVE_SONGS:
             filtered_count += 1
             continue
 
-        sound_stats[sound_key]['total_uses'] += 1
-        sound_stats[sound_key]['total_views'] += video['views']
-        sound_stats[sound_key]['total_likes'] += video['likes']
-        sound_stats[sound_key]['total_comments'] += video['comments']
-        sound_stats[sound_key]['total_shares'] += video['shares']
-        sound_stats[sound_key]['total_engagement'] += video['engagement_rate']
-        sound_stats[sound_key]['videos'].append(video)
-        sound_stats[sound_key]['accounts'].add(video['account'])
-        sound_stats[sound_key]['song'] = song
-        sound_stats[sound_key]['artist'] = artist
+        totals = sound_totals[sound_key]
+        totals[0] += 1
+        totals[1] += views
+        totals[2] += likes
+        totals[3] += comments
+        totals[4] += shares
+        totals[5] += engagement_rate
+        totals[6].append(video)
+        totals[7].add(account)
+        totals[8] = video['song_title'] or 'Unknown'
+        totals[9] = video['song_artist'] or 'Unknown'
 
     print(f"  Filtered out {filtered_count} videos using exclusive songs")
 
-    # Calculate averages and sort
-    for sound_key, stats in sound_stats.items():
-        uses = stats['total_uses']
-        stats['avg_views'] = stats['total_views'] // uses if uses > 0 else 0
-        stats['avg_likes'] = stats['total_likes'] // uses if uses > 0 else 0
-        stats['avg_comments'] = stats['total_comments'] // uses if uses > 0 else 0
-        stats['avg_shares'] = stats['total_shares'] // uses if uses > 0 else 0
-        stats['avg_engagement_rate'] = stats['total_engagement'] / uses if uses > 0 else 0
-
-        # Sort videos by views
-        stats['videos'].sort(key=lambda x: x['views'], reverse=True)
-
-        # Convert accounts set to list
-        stats['accounts'] = sorted(list(stats['accounts']))
-
-    return sound_stats
-
-def aggregate_by_account(all_videos):
-    """Aggregate videos by account"""
-    account_stats = defaultdict(lambda: {
-        'total_videos': 0,
-        'total_views': 0,
-        'total_likes': 0,
-        'total_comments': 0,
-        'total_shares': 0,
-        'total_engagement': 0,
-        'videos': [],
-        'unique_sounds': set()
-    })
+    # Build the per-sound records with averages in one pass
+    sound_stats = {}
+    for sound_key, (uses, views, likes, comments, shares, engagement, videos, accounts, song, artist) in sound_totals.items():
+        sound_stats[sound_key] = {
+            'total_uses': uses,
+            'total_views': views,
+            'total_likes': likes,
+            'total_comments': comments,
+            'total_shares': shares,
+            'total_engagement': engagement,
+            'videos': videos,
+            'accounts': sorted(accounts),
+            'song': song,
+            'artist': artist,
+            'avg_views': views // uses,
+            'avg_likes': likes // uses,
+            'avg_comments': comments // uses,
+            'avg_shares': shares // uses,
+            'avg_engagement_rate': engagement / uses
+        }
+
+    # Build the per-account records with averages in one pass
+    account_stats = {}
+    for account, (video_count, views, likes, comments, shares, engagement, top_videos, unique_sounds) in account_totals.items():
+        account_stats[account] = {
+            'total_videos': video_count,
+            'total_views': views,
+            'total_likes': likes,
+            'total_comments': comments,
+            'total_shares': shares,
+            'total_engagement': engagement,
+            'top_videos': top_videos,
+            'unique_sounds': unique_sounds,
+            'avg_views': views // video_count,
+            'avg_likes': likes // video_count,
+            'avg_comments': comments // video_count,
+            'avg_shares': shares // video_count,
+            'avg_engagement_rate': engagement / video_count,
+            # Count unique sounds
+            'unique_sounds_count': len(unique_sounds)
+        }
 
-    for video in all_videos:
-        account = video['account']
-        sound_key = f"{video['song_title'] or 'Unknown'} - {video['song_artist'] or 'Unknown'}"
-
-        account_stats[account]['total_videos'] += 1
-        account_stats[account]['total_views'] += video['views']
-        account_stats[account]['total_likes'] += video['likes']
-        account_stats[account]['total_comments'] += video['comments']
-        account_stats[account]['total_shares'] += video['shares']
-        account_stats[account]['total_engagement'] += video['engagement_rate']
-        account_stats[account]['videos'].append(video)
-        account_stats[account]['unique_sounds'].add(sound_key)
-
-    # Calculate averages
-    for account, stats in account_stats.items():
-        video_count = stats['total_videos']
-        stats['avg_views'] = stats['total_views'] // video_count if video_count > 0 else 0
-        stats['avg_likes'] = stats['total_likes'] // video_count if video_count > 0 else 0
-        stats['avg_comments'] = stats['total_comments'] // video_count if video_count > 0 else 0
-        stats['avg_shares'] = stats['total_shares'] // video_count if video_count > 0 else 0
-        stats['avg_engagement_rate'] = stats['total_engagement'] / video_count if video_count > 0 else 0
-
-        # Sort videos by views
-        stats['videos'].sort(key=lambda x: x['views'], reverse=True)
-
-        # Count unique sounds
-        stats['unique_sounds_count'] = len(stats['unique_sounds'])
-
-    return account_stats
+    return sound_stats, account_stats
 
+@lru_cache(maxsize=4096)
 def format_number(num):
     """Format number with K/M suffix"""
     if num >= 1000000:
@@ -206,17 +293,22 @@ def format_number(num):
     else:
         return str(num)
 
+# Characters that must not reach the page raw from scraped titles/handles/URLs
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'})
+
+def escape_html(text):
+    """Escape text for HTML content or attribute values (one C-level translate)"""
+    return text.translate(_HTML_ESCAPE) if text else ''
+
+# Engagement CSS classes indexed by how many thresholds (5%, 10%) a rate clears
+_ENGAGEMENT_CLASSES = ('engagement-low', 'engagement-medium', 'engagement-high')
+
 def get_engagement_class(rate):
     """Get CSS class for engagement rate"""
-    if rate >= 10:
-        return 'engagement-high'
-    elif rate >= 5:
-        return 'engagement-medium'
-    else:
-        return 'engagement-low'
+    return _ENGAGEMENT_CLASSES[(rate >= 5) + (rate >= 10)]
 
-def generate_html(sound_stats, account_stats, total_videos):
-    """Generate HTML report with glassmorphism design and tabs"""
+def generate_html(sound_stats, account_stats, total_videos, out):
+    """Write HTML report with glassmorphism design and tabs to the open file out"""
 
     # Sort sounds by total uses, then by average views
     sorted_sounds = sorted(
@@ -232,7 +324,11 @@ def generate_html(sound_stats, account_stats, total_videos):
         reverse=True
     )
 
-    html = f'''<!DOCTYPE html>
+    # Stream chunks straight to the file instead of holding the whole page
+    write = out.write
+    esc = escape_html
+
+    write(f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -677,17 +773,17 @@ def generate_html(sound_stats, account_stats, total_videos):
 
         <!-- Sounds Tab -->
         <div id="sounds-tab" class="tab-content active">
-'''
+''')
 
     # Generate sound cards
     for rank, (sound_key, stats) in enumerate(sorted_sounds, 1):
         accounts_list = ', '.join(stats['accounts'])
 
-        html += f'''
+        write(f'''
             <div class="sound-card">
             <div class="sound-header">
-                <div class="sound-title">#{rank} • {stats['song']}</div>
-                <div class="sound-artist">{stats['artist']}</div>
+                <div class="sound-title">#{rank} • {esc(stats['song'])}</div>
+                <div class="sound-artist">{esc(stats['artist'])}</div>
                 <div class="sound-meta">
                     <div class="sound-meta-item">
                         <span>Total Uses:</span>
@@ -735,20 +831,21 @@ def generate_html(sound_stats, account_stats, total_videos):
                 <h3 class="videos-header">All Videos Using This Sound (Ranked by Views)</h3>
                 <div class="table-wrapper">
                     <table class="video-table">
-'''
+''')
 
-        # Generate video rows
+        # Generate video rows, joined so the whole table body goes out in one write
+        rows = []
         for video in stats['videos']:
             engagement_class = get_engagement_class(video['engagement_rate'])
 
-            html += f'''
+            rows.append(f'''
                         <tr class="video-row">
                             <td>
-                                <div class="video-account">{video['account']}</div>
-                                <div class="video-date">{video['upload_date']}</div>
+                                <div class="video-account">{esc(video['account'])}</div>
+                                <div class="video-date">{esc(video['upload_date'])}</div>
                             </td>
                             <td>
-                                <a href="{video['url']}" target="_blank" class="video-link">View Video →</a>
+                                <a href="{esc(video['url'])}" target="_blank" class="video-link">View Video →</a>
                             </td>
                             <td>
                                 <div class="video-stats">
@@ -763,23 +860,24 @@ def generate_html(sound_stats, account_stats, total_videos):
                                 </span>
                             </td>
                         </tr>
-'''
+''')
+        write(''.join(rows))
 
-        html += '''
+        write('''
                     </table>
                 </div>
             </div>
             </div>
-'''
+''')
 
     # Close sounds tab and start accounts tab
-    html += '''
+    write('''
         </div>
         <!-- End Sounds Tab -->
 
         <!-- Accounts Tab -->
         <div id="accounts-tab" class="tab-content">
-'''
+''')
 
     # Generate account cards sorted by performance (worst to best to help identify laggards)
     for rank, (account, stats) in enumerate(sorted_accounts, 1):
@@ -795,11 +893,12 @@ def generate_html(sound_stats, account_stats, total_videos):
             perf_text = 'Low'
 
         engagement_class = get_engagement_class(stats['avg_engagement_rate'])
+        account_html = esc(account)
 
-        html += f'''
+        write(f'''
             <div class="sound-card">
                 <div class="sound-header">
-                    <div class="sound-title">#{rank} • {account} <span class="performance-indicator {perf_class}"></span></div>
+                    <div class="sound-title">#{rank} • {account_html} <span class="performance-indicator {perf_class}"></span></div>
                     <div class="sound-meta">
                         <div class="sound-meta-item">
                             <span>Performance:</span>
@@ -848,24 +947,25 @@ def generate_html(sound_stats, account_stats, total_videos):
                 </div>
 
                 <div class="videos-section">
-                    <h3 class="videos-header">Recent Videos from {account} (Ranked by Views)</h3>
+                    <h3 class="videos-header">Recent Videos from {account_html} (Ranked by Views)</h3>
                     <div class="table-wrapper">
                         <table class="video-table">
-'''
+''')
 
-        # Show top 10 videos for each account
-        for video in stats['videos'][:10]:
+        # Show top videos for each account (one write for the block)
+        rows = []
+        for video in stats['top_videos']:
             video_eng_class = get_engagement_class(video['engagement_rate'])
             song_display = f"{video['song_title'] or 'Unknown'}" if video['song_title'] else "Unknown"
 
-            html += f'''
+            rows.append(f'''
                             <tr class="video-row">
                                 <td>
-                                    <div class="video-date">{video['upload_date']}</div>
-                                    <div style="color: #9ca3af; font-size: 0.75rem; margin-top: 4px;">{song_display}</div>
+                                    <div class="video-date">{esc(video['upload_date'])}</div>
+                                    <div style="color: #9ca3af; font-size: 0.75rem; margin-top: 4px;">{esc(song_display)}</div>
                                 </td>
                                 <td>
-                                    <a href="{video['url']}" target="_blank" class="video-link">View Video →</a>
+                                    <a href="{esc(video['url'])}" target="_blank" class="video-link">View Video →</a>
                                 </td>
                                 <td>
                                     <div class="video-stats">
@@ -880,16 +980,17 @@ def generate_html(sound_stats, account_stats, total_videos):
                                     </span>
                                 </td>
                             </tr>
-'''
+''')
+        write(''.join(rows))
 
-        html += '''
+        write('''
                         </table>
                     </div>
                 </div>
             </div>
-'''
+''')
 
-    html += '''
+    write('''
         </div>
         <!-- End Accounts Tab -->
 
@@ -921,11 +1022,14 @@ def generate_html(sound_stats, account_stats, total_videos):
     </script>
 </body>
 </html>
-'''
-
-    return html
+''')
 
 def main():
+    parser = argparse.ArgumentParser(description='Scrape the in-house network and generate the HTML tracker')
+    parser.add_argument('--no-cache', action='store_true',
+                       help="Re-run yt-dlp even if today's output for an account is cached")
+    args = parser.parse_args()
+
     print("\n" + "="*80)
     print("IN-HOUSE NETWORK TRACKER - OCT-NOV 2025")
     print("="*80)
@@ -933,8 +1037,8 @@ def main():
 
     all_videos = []
 
-    for account in ACCOUNTS:
-        videos = scrape_account(account)  # No limit - scrape ALL videos
+    # No limit - scrape ALL videos from every account
+    for videos in asyncio.run(scrape_all_accounts(ACCOUNTS, use_cache=not args.no_cache)):
         all_videos.extend(videos)
 
     print(f"\n{'='*80}")
@@ -945,20 +1049,19 @@ def main():
         print("⚠️  No videos found from October 2025 onwards. Exiting.")
         return
 
-    print("Aggregating by sound...")
-    sound_stats = aggregate_by_sound(all_videos)
-    print(f"Found {len(sound_stats)} unique sounds (after filtering)\n")
+    # Sort once by views so every per-sound/per-account video list comes out ranked
+    all_videos.sort(key=itemgetter('views'), reverse=True)
 
-    print("Aggregating by account...")
-    account_stats = aggregate_by_account(all_videos)
+    print("Aggregating by sound and account...")
+    sound_stats, account_stats = aggregate_videos(all_videos)
+    print(f"Found {len(sound_stats)} unique sounds (after filtering)")
     print(f"Analyzed {len(account_stats)} accounts\n")
 
     print("Generating HTML report...")
-    html_content = generate_html(sound_stats, account_stats, len(all_videos))
-
     output_file = config.NETWORK_TRACKER_OUTPUT_FILE
-    with open(str(output_file), 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # 1 MiB buffer so the streamed chunks reach disk in a few large writes
+    with open(str(output_file), 'w', encoding='utf-8', buffering=1 << 20) as f:
+        generate_html(sound_stats, account_stats, len(all_videos), f)
 
     print(f"✓ HTML report generated: {output_file}")
     print(f"\n{'='*80}\n")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Shared tiktok_analyzer.py account scraping for the catalog and production scrapers
+"""
+
+import asyncio
+import json
+import re
+
+# Max tiktok_analyzer.py subprocesses running at once
+MAX_CONCURRENT_SCRAPES = 8
+
+# Per-line read limit for analyzer output (JSON records can exceed asyncio's 64 KiB default)
+ANALYZER_LINE_LIMIT = 2 ** 20
+
+# Upload dates the analyzer could not normalize are treated as unknown
+_RE_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}$')
+
+async def scrape_account_videos(username, limit=500, start_date=None):
+    """Scrape videos from a TikTok account using tiktok_analyzer.py"""
+    print(f"  Running yt-dlp scraper for @{username} (limit: {limit} videos)...")
+
+    cmd = [
+        'python3', 'tiktok_analyzer.py',
+        '--url', username,
+        '--limit', str(limit),
+        '--json'
+    ]
+
+    proc = stderr_task = None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            limit=ANALYZER_LINE_LIMIT
+        )
+        # Drain stderr alongside stdout so a chatty child can't block on a full pipe
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
+
+        async def read_records():
+            """Decode the analyzer's JSON lines as it prints them (other lines are logs)"""
+            records = []
+            async for raw_line in proc.stdout:
+                if raw_line.startswith(b'{'):
+                    try:
+                        records.append(json.loads(raw_line))
+                    except json.JSONDecodeError:
+                        continue  # Log line that merely starts with '{'
+            await proc.wait()
+            return records
+
+        try:
+            records = await asyncio.wait_for(read_records(), timeout=600)
+        except asyncio.TimeoutError:
+            print("    ⚠️  Timeout after 10 minutes")
+            return []
+
+        stderr = await stderr_task
+        if proc.returncode != 0:
+            print(f"    ⚠️  Scrape failed: {stderr.decode('utf-8', 'replace')[:100]}")
+            return []
+
+        # Build video data from the analyzer records. Dates are ISO YYYY-MM-DD, so the
+        # cutoff is a plain string comparison (no per-video strptime)
+        videos = []
+        start_str = start_date.strftime('%Y-%m-%d') if start_date else None
+
+        for record in records:
+            video_url = record.get('url')
+            if not video_url:
+                continue
+
+            upload_date = record.get('upload_date') or 'Unknown'
+            if not _RE_ISO_DATE.match(upload_date):
+                upload_date = 'Unknown'
+
+            # Filter by date if provided (before any per-video sound ID work)
+            if start_str and upload_date != 'Unknown' and upload_date < start_str:
+                continue  # Skip videos before start date
+
+            # Engagement metrics (yt-dlp reports null for hidden counts)
+            views = record.get('views') or 0
+            likes = record.get('likes') or 0
+            comments = record.get('comments') or 0
+            shares = record.get('shares') or 0
+
+            # Caption/title (same placeholder the text report used)
+            title = (record.get('title') or '').strip() or '(No caption)'
+
+            video_data = {
+                'account': username,
+                'url': video_url,
+                'upload_date': upload_date,
+                'title': title,
+                'views': views,
+                'likes': likes,
+                'comments': comments,
+                'shares': shares,
+                # Sound ID the analyzer already read from the video page (None if it failed)
+                'sound_id': record.get('music_id'),
+                'song_title': record.get('song_title') or ''
+            }
+
+            videos.append(video_data)
+
+        return videos
+
+    except Exception as e:
+        print(f"    ⚠️  Error: {str(e)[:100]}")
+        return []
+    finally:
+        # Never leave the analyzer running, whatever cut the read short
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        if stderr_task is not None and not stderr_task.done():
+            stderr_task.cancel()
+
+async def scrape_all_accounts(accounts, limit=500, start_date=None):
+    """Scrape all accounts concurrently (capped at MAX_CONCURRENT_SCRAPES), in account order"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+    async def bounded_scrape(username):
+        async with semaphore:
+            return await scrape_account_videos(username, limit=limit, start_date=start_date)
+
+    return await asyncio.gather(*(bounded_scrape(username) for username in accounts))
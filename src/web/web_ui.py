@@ -78,6 +78,20 @@ MUSIC_LINKS_WHITELIST_FILE = OUTPUT_DIR / 'music_links_whitelist.json'
 ACCOUNTS_WHITELIST_FILE = OUTPUT_DIR / 'accounts_whitelist.json'
 CSV_REPORT_FILE = PROJECT_ROOT / 'warner_song_usage_report_COMPLETE.csv'
 
+# tiktok_analyzer.py report fields; each pattern starts with a literal so
+# sre can use its prefix scan to jump straight to the field
+_RE_VIDEO_HEADER = re.compile(r'VIDEO #\d+')
+_RE_URL = re.compile(r'URL: (https://www\.tiktok\.com/@[^/]+/video/\d+)')
+_RE_VIDEO_ID = re.compile(r'/video/(\d+)')
+_RE_UPLOAD_DATE = re.compile(r'Upload Date: (\d{4}-\d{2}-\d{2})')
+_RE_CAPTION = re.compile(r'Title/Caption: (.+?)(?:\n|URL:)', re.DOTALL)
+_RE_VIEWS = re.compile(r'Views:\s+[\d.KMB]+\s+\(([,\d]+)\)')
+_RE_LIKES = re.compile(r'Likes:\s+[\d.KMB]+\s+\(([,\d]+)\)')
+_RE_COMMENTS = re.compile(r'Comments:\s+[\d.KMB]+\s+\(([,\d]+)\)')
+_RE_SHARES = re.compile(r'Shares:\s+[\d.KMB]+\s+\(([,\d]+)\)')
+_RE_SONG = re.compile(r'Song: (.+)')
+_RE_ARTIST = re.compile(r'Artist: (.+)')
+
 
 # ============================================================================
 # SETTINGS MANAGEMENT
@@ -328,8 +342,6 @@ def scrape_account_background(session_id, username, settings):
 
 def parse_analyzer_output(output, username, start_date=None, end_date=None):
     """Parse tiktok_analyzer.py output into structured data."""
-    import re
-
     videos = []
 
     # Parse dates
@@ -337,21 +349,21 @@ def parse_analyzer_output(output, username, start_date=None, end_date=None):
     end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
 
     # Split by video sections
-    video_sections = re.split(r'VIDEO #\d+', output)
+    video_sections = _RE_VIDEO_HEADER.split(output)
 
     for section in video_sections[1:]:  # Skip first empty section
         video = {}
 
         # Extract URL
-        url_match = re.search(r'URL: (https://www\.tiktok\.com/@[^/]+/video/\d+)', section)
+        url_match = _RE_URL.search(section)
         if url_match:
             video['url'] = url_match.group(1)
-            video_id_match = re.search(r'/video/(\d+)', video['url'])
+            video_id_match = _RE_VIDEO_ID.search(video['url'])
             if video_id_match:
                 video['video_id'] = video_id_match.group(1)
 
         # Extract upload date
-        date_match = re.search(r'Upload Date: (\d{4}-\d{2}-\d{2})', section)
+        date_match = _RE_UPLOAD_DATE.search(section)
         if date_match:
             video['upload_date'] = date_match.group(1)
             upload_dt = datetime.strptime(video['upload_date'], '%Y-%m-%d')
@@ -363,15 +375,15 @@ def parse_analyzer_output(output, username, start_date=None, end_date=None):
                 continue
 
         # Extract caption
-        caption_match = re.search(r'Title/Caption: (.+?)(?:\n|URL:)', section, re.DOTALL)
+        caption_match = _RE_CAPTION.search(section)
         if caption_match:
             video['caption'] = caption_match.group(1).strip()
 
         # Extract metrics
-        views_match = re.search(r'Views:\s+[\d.KMB]+\s+\(([,\d]+)\)', section)
-        likes_match = re.search(r'Likes:\s+[\d.KMB]+\s+\(([,\d]+)\)', section)
-        comments_match = re.search(r'Comments:\s+[\d.KMB]+\s+\(([,\d]+)\)', section)
-        shares_match = re.search(r'Shares:\s+[\d.KMB]+\s+\(([,\d]+)\)', section)
+        views_match = _RE_VIEWS.search(section)
+        likes_match = _RE_LIKES.search(section)
+        comments_match = _RE_COMMENTS.search(section)
+        shares_match = _RE_SHARES.search(section)
 
         if views_match:
             video['views'] = int(views_match.group(1).replace(',', ''))
@@ -392,8 +404,8 @@ def parse_analyzer_output(output, username, start_date=None, end_date=None):
             video['engagement_rate'] = round((total_engagement / video['views']) * 100, 2)
 
         # Extract song info
-        song_match = re.search(r'Song: (.+)', section)
-        artist_match = re.search(r'Artist: (.+)', section)
+        song_match = _RE_SONG.search(section)
+        artist_match = _RE_ARTIST.search(section)
 
         if song_match:
             video['song_title'] = song_match.group(1).strip()
@@ -68,17 +68,35 @@ def generate_csv_files_from_videos(videos, output_dir):
     Returns:
         Tuple of (csv_files_created, total_rows, file_list)
     """
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
     # Group videos by song
     sound_stats = group_videos_by_song(videos)
     
+    return generate_csv_files_from_groups(sorted(sound_stats.items()), output_dir)
+
+
+def generate_csv_files_from_groups(groups, output_dir):
+    """
+    Generate CSV file for each song from videos that are already grouped.
+    
+    Groups are consumed one at a time, so callers can pass a generator and
+    avoid building a flat list of every video first.
+    
+    Args:
+        groups: Iterable of (sound_key, stats) pairs, where stats has 'song',
+            'artist' and 'videos' (a list of video dictionaries) keys
+        output_dir: Path to output directory for CSV files
+    
+    Returns:
+        Tuple of (csv_files_created, total_rows, file_list)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
     csv_files_created = 0
     total_rows = 0
     file_list = []
     
-    for sound_key, stats in sorted(sound_stats.items()):
+    for sound_key, stats in groups:
         if not stats['videos']:
             continue
         